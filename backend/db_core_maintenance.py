@@ -32,7 +32,9 @@ def seed_alumni_data():
 
         try:
             with conn.cursor() as cur:
-                for index, row in df.iterrows():
+                # Plain dicts per row: iterrows() builds (and dtype-coerces) a Series
+                # for every record, and the loop only ever calls row.get().
+                for row in df.to_dict('records'):
                     processed += 1
 
                     # Parse name (Handle New 'first', 'last' OR Old 'name')
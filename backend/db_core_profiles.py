@@ -92,6 +92,16 @@ def sync_alumni_to_visited_profiles():
         return 0
 
 
+_VISITED_MIGRATION_BATCH_SIZE = 500
+_VISITED_MIGRATION_UPSERT_SQL = """
+    INSERT INTO visited_profiles (linkedin_url, is_unt_alum, visited_at, last_checked)
+    VALUES (%s, %s, %s, NOW())
+    ON DUPLICATE KEY UPDATE
+        is_unt_alum = GREATEST(is_unt_alum, VALUES(is_unt_alum)),
+        last_checked = NOW()
+"""
+
+
 def migrate_visited_history_csv_to_db():
     """
     One-time migration: Import visited_history.csv into the visited_profiles table.
@@ -111,32 +121,37 @@ def migrate_visited_history_csv_to_db():
         logger.info(f"≡ƒôé Migrating {len(df)} entries from visited_history.csv to database...")
 
         migrated = 0
+        rows = []
+        for row in df.to_dict('records'):
+            url = normalize_url(row.get('profile_url'))
+            if not url:
+                continue
 
-        with managed_db_cursor(get_connection, commit=True) as (_conn, cur):
-            for _, row in df.iterrows():
-                url = normalize_url(row.get('profile_url'))
-                if not url:
-                    continue
-
-                saved = str(row.get('saved', 'no')).strip().lower() == 'yes'
-                visited_at = row.get('visited_at', None)
+            saved = str(row.get('saved', 'no')).strip().lower() == 'yes'
+            visited_at = row.get('visited_at', None)
 
-                # Handle NaN/empty visited_at
-                if pd.isna(visited_at) or visited_at == 'nan' or visited_at == '':
-                    visited_at = None
+            # Handle NaN/empty visited_at
+            if pd.isna(visited_at) or visited_at == 'nan' or visited_at == '':
+                visited_at = None
+            rows.append((url, saved, visited_at))
 
+        with managed_db_cursor(get_connection, commit=True) as (_conn, cur):
+            # One executemany round trip per batch; a batch that fails is
+            # replayed row by row so a single bad URL only skips itself.
+            for start in range(0, len(rows), _VISITED_MIGRATION_BATCH_SIZE):
+                batch = rows[start:start + _VISITED_MIGRATION_BATCH_SIZE]
                 try:
-                    cur.execute("""
-                        INSERT INTO visited_profiles (linkedin_url, is_unt_alum, visited_at, last_checked)
-                        VALUES (%s, %s, %s, NOW())
-                        ON DUPLICATE KEY UPDATE
-                            is_unt_alum = GREATEST(is_unt_alum, VALUES(is_unt_alum)),
-                            last_checked = NOW()
-                    """, (url, saved, visited_at))
-                    migrated += 1
-                except mysql.connector.Error as err:
-                    logger.warning(f"Skipping {url}: {err}")
+                    cur.executemany(_VISITED_MIGRATION_UPSERT_SQL, batch)
+                    migrated += len(batch)
                     continue
+                except mysql.connector.Error as err:
+                    logger.warning(f"Batch insert failed ({err}); retrying {len(batch)} rows individually")
+                for params in batch:
+                    try:
+                        cur.execute(_VISITED_MIGRATION_UPSERT_SQL, params)
+                        migrated += 1
+                    except mysql.connector.Error as err:
+                        logger.warning(f"Skipping {params[0]}: {err}")
 
         logger.info(f"Migrated {migrated} profiles from CSV to database")
         return migrated
@@ -136,6 +136,11 @@ class SQLiteCursorWrapper:
         else:
             self._cursor.execute(translated_query)
     
+    def executemany(self, query, seq_of_params):
+        """Execute one statement per parameter tuple (mysql-connector compatible)."""
+        for params in seq_of_params:
+            self.execute(query, params)
+    
     def _convert_upsert(self, query):
         """
         Convert MySQL ON DUPLICATE KEY UPDATE to SQLite ON CONFLICT DO UPDATE.
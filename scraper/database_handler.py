@@ -1,13 +1,22 @@
+import atexit
+import csv
 import os
 import shutil
+import time
 import pandas as pd
 import mysql.connector
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 import sys
 from typing import Optional
 
+try:
+    import fcntl  # POSIX only; appends go unlocked elsewhere (e.g. Windows)
+except ImportError:
+    fcntl = None
+
 # Hack for imports if needed, or adjust structure
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'backend'))
 from database import save_visited_profile, get_all_visited_profiles, normalize_url as db_normalize_url
@@ -18,47 +27,131 @@ from settings import (
 )
 from scraper_utils import parse_frequency, clean_job_title
 
-def get_outdated_profiles_from_db():
-    try:
-        conn = mysql.connector.connect(
+# Created on first use so importing this module never opens a MySQL connection.
+_mysql_pool = None
+
+
+def _get_mysql_connection():
+    """Borrow a connection from the shared pool (``close()`` returns it to the pool)."""
+    global _mysql_pool
+    if _mysql_pool is None:
+        _mysql_pool = mysql.connector.pooling.MySQLConnectionPool(
+            pool_name="scraper_alumni",
+            pool_size=2,
             host=os.getenv('MYSQLHOST'),
             user=os.getenv('MYSQLUSER'),
             password=os.getenv('MYSQLPASSWORD'),
             database=os.getenv('MYSQL_DATABASE'),
             port=int(os.getenv('MYSQLPORT', 3306))
         )
-        frequency_delta = parse_frequency(UPDATE_FREQUENCY)
-        cutoff_date = datetime.now() - frequency_delta
+    return _mysql_pool.get_connection()
+
+
+def get_outdated_cutoff_date():
+    """Profiles last updated before this moment are due for a re-scrape."""
+    return datetime.now() - parse_frequency(UPDATE_FREQUENCY)
 
-        with conn.cursor() as cur:
+
+def iter_outdated_profiles_from_db(cutoff_date):
+    """
+    Yield (linkedin_url, first_name, last_name, last_updated) rows older than
+    ``cutoff_date``, oldest first, streaming them from the server.
+    """
+    conn = _get_mysql_connection()
+    try:
+        # Unbuffered cursor: rows arrive as the caller iterates instead of being
+        # buffered by the driver first.
+        with conn.cursor(buffered=False) as cur:
             cur.execute("""
                 SELECT linkedin_url, first_name, last_name, last_updated
                 FROM alumni
                 WHERE last_updated < %s
                 ORDER BY last_updated ASC
             """, (cutoff_date,))
-            profiles = cur.fetchall()
-        conn.close()
-        return profiles, cutoff_date
+            yield from cur
+    finally:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+def get_outdated_profiles_from_db():
+    try:
+        cutoff_date = get_outdated_cutoff_date()
+        return list(iter_outdated_profiles_from_db(cutoff_date)), cutoff_date
     except Exception as e:
         logger.error(f"Error fetching outdated profiles: {e}")
         return [], None
 
+
+def _parse_timestamp_strings(values):
+    """
+    Parse a collection of ISO timestamp strings in one pandas call.
+    Returns {raw string: naive datetime}; unparseable values are left out.
+    """
+    values = list(values)
+    if not values:
+        return {}
+    try:
+        try:
+            parsed = pd.to_datetime(pd.Series(values), errors='coerce', utc=True, format='ISO8601')
+        except (TypeError, ValueError):
+            # pandas < 2.0 has no 'ISO8601' format; let it infer instead.
+            parsed = pd.to_datetime(pd.Series(values), errors='coerce', utc=True)
+        parsed = parsed.dt.tz_localize(None)
+    except Exception as e:
+        logger.debug(f"Batch timestamp parse failed: {e}")
+        return {}
+    return {
+        raw: ts.to_pydatetime()
+        for raw, ts in zip(values, parsed)
+        if not pd.isna(ts)
+    }
+
+
+# Canonical objects for the yes/no history flags. Entries loaded from CSV would
+# otherwise each carry their own copies of these strings.
+_HISTORY_FLAG_VALUES = {"yes": "yes", "no": "no"}
+
+
 class HistoryManager:
+    # Visits are appended through one open handle and flushed after every row,
+    # so a killed run (the GUI stop button sends SIGTERM/SIGKILL, which skip
+    # atexit) loses nothing; load_from_csv lets later rows win, so appends are
+    # enough. Once this many rows in the file are superseded by later ones, the
+    # file is compacted with a full rewrite.
+    _COMPACT_EVERY = 500
+    # A repeat mark_as_visited with the same outcome inside this window (e.g. a
+    # profile showing up again on an overlapping search page) is a no-op.
+    _RECENT_WRITE_TTL_SECONDS = 600
+    _RECENT_WRITE_MAX = 4096
+
     def __init__(self):
         self.visited_history = {}
+        self._append_fh = None
+        self._append_writer = None
+        # Compaction rewrites from memory, so it only runs once the file's
+        # contents have been loaded (or rebuilt from the DB).
+        self._history_loaded = False
+        self._superseded_rows = 0
+        # url -> ((saved, update_needed), monotonic time) of the last successful write.
+        self._recent_writes = {}
+        # URLs should_skip answers True for, kept in step with visited_history so
+        # the per-URL check is one set lookup.
+        self._skip_urls = set()
         self._ensure_csv_headers()
 
     def _ensure_csv_headers(self):
+        # Only the header line is read; the rows are irrelevant to this check.
         try:
-            if VISITED_HISTORY_FILE.exists():
-                df = pd.read_csv(VISITED_HISTORY_FILE)
-                if list(df.columns) != VISITED_HISTORY_COLUMNS:
-                    raise ValueError("Mismatch")
-            else:
-                pd.DataFrame(columns=VISITED_HISTORY_COLUMNS).to_csv(VISITED_HISTORY_FILE, index=False)
+            with open(VISITED_HISTORY_FILE, 'r', newline='', encoding='utf-8') as f:
+                if next(csv.reader(f), None) == VISITED_HISTORY_COLUMNS:
+                    return
         except Exception:
-            pd.DataFrame(columns=VISITED_HISTORY_COLUMNS).to_csv(VISITED_HISTORY_FILE, index=False)
+            pass
+        with open(VISITED_HISTORY_FILE, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerow(VISITED_HISTORY_COLUMNS)
 
     @staticmethod
     def _normalize_profile_url(url):
@@ -68,26 +161,75 @@ class HistoryManager:
         cleaned = normalized.strip().split('?', 1)[0].split('#', 1)[0]
         return cleaned.rstrip('/')
 
+    @classmethod
+    def _history_key(cls, url):
+        # Interned so visited_history, _skip_urls and _recent_writes all hold
+        # one shared string (with its cached hash) per profile URL.
+        normalized = cls._normalize_profile_url(url)
+        return sys.intern(normalized) if normalized else ""
+
     def load_from_csv(self):
         if VISITED_HISTORY_FILE.exists():
             try:
-                df = pd.read_csv(VISITED_HISTORY_FILE)
+                # One bulk read + C-level line split; the csv module then parses
+                # the in-memory lines without building a DataFrame first.
+                data = VISITED_HISTORY_FILE.read_text(encoding='utf-8', errors='ignore')
                 self.visited_history = {}
-                for _, row in df.iterrows():
-                    url = self._normalize_profile_url(row.get('profile_url'))
+                flags = _HISTORY_FLAG_VALUES
+                row_count = 0
+                # Positional rows with the column order taken from the header:
+                # no per-row dict is built just to be read once and dropped.
+                reader = csv.reader(data.splitlines())
+                header = next(reader, None) or []
+                column_index = {name: i for i, name in enumerate(header)}
+
+                def _column(name, default):
+                    i = column_index.get(name)
+                    return (lambda row: row[i] if i < len(row) else '') if i is not None else (lambda row: default)
+
+                get_url = _column('profile_url', '')
+                get_saved = _column('saved', 'no')
+                get_visited_at = _column('visited_at', '')
+                get_update_needed = _column('update_needed', 'yes')
+                get_last_db_update = _column('last_db_update', '')
+                for row in reader:
+                    url = self._history_key(get_url(row))
                     if not url: continue
+                    row_count += 1
+                    saved = get_saved(row).strip().lower()
+                    update_needed = get_update_needed(row).strip().lower()
+                    visited_at = get_visited_at(row).strip()
+                    last_db_update = get_last_db_update(row).strip()
                     self.visited_history[url] = {
-                        'saved': str(row.get('saved', 'no')).strip().lower(),
-                        'visited_at': str(row.get('visited_at', '')).strip(),
-                        'update_needed': str(row.get('update_needed', 'yes')).strip().lower(),
-                        'last_db_update': str(row.get('last_db_update', '')).strip()
+                        'saved': flags.get(saved, saved),
+                        'visited_at': visited_at,
+                        'update_needed': flags.get(update_needed, update_needed),
+                        # Usually the same timestamp (mark_as_visited writes both).
+                        'last_db_update': visited_at if last_db_update == visited_at else last_db_update,
                     }
                 logger.info(f"📜 Loaded {len(self.visited_history)} URLs from visited history")
+                self._history_loaded = True
+                self._superseded_rows = row_count - len(self.visited_history)
+                if self._superseded_rows >= self._COMPACT_EVERY:
+                    logger.info(f"🧹 Compacting visited history ({self._superseded_rows} superseded rows)")
+                    self.save_history_csv()
             except Exception as e:
                 logger.error(f"Error loading visited history: {e}")
                 self.visited_history = {}
         else:
             self.visited_history = {}
+        self._rebuild_skip_index()
+
+    @staticmethod
+    def _is_skip_entry(entry):
+        # Everything already visited is skipped except UNT alumni due for an update.
+        return not (
+            str(entry.get('saved', 'no')).lower() == 'yes'
+            and str(entry.get('update_needed', 'no')).lower() == 'yes'
+        )
+
+    def _rebuild_skip_index(self):
+        self._skip_urls = {url for url, entry in self.visited_history.items() if self._is_skip_entry(entry)}
 
     def sync_with_db(self):
         logger.info("\n📊 Initializing visited history from database...")
@@ -97,12 +239,18 @@ class HistoryManager:
             self.load_from_csv()
             return
 
-        frequency_delta = parse_frequency(UPDATE_FREQUENCY)
         now = datetime.now()
+        cutoff = now - parse_frequency(UPDATE_FREQUENCY)
+        # MySQL hands back datetimes; only string timestamps (SQLite fallback)
+        # need parsing, and those are converted in one batch up front.
+        parsed_checked = _parse_timestamp_strings({
+            profile['last_checked'] for profile in db_profiles
+            if isinstance(profile.get('last_checked'), str)
+        })
 
         self.visited_history = {}
         for profile in db_profiles:
-            url = self._normalize_profile_url(profile.get('linkedin_url'))
+            url = self._history_key(profile.get('linkedin_url'))
             if not url: continue
 
             is_unt = bool(profile.get('is_unt_alum'))
@@ -113,14 +261,12 @@ class HistoryManager:
             if needs_update_db:
                 update_needed = 'yes'
             elif is_unt and last_checked:
-                # Basic date parsing logic if string
                 if isinstance(last_checked, str):
-                    try: last_checked_dt = datetime.fromisoformat(last_checked.replace('Z', '+00:00'))
-                    except (ValueError, TypeError): last_checked_dt = now
+                    last_checked_dt = parsed_checked.get(last_checked) or now
                 else:
                     last_checked_dt = last_checked
-                
-                if (now - last_checked_dt) > frequency_delta:
+
+                if last_checked_dt < cutoff:
                     update_needed = 'yes'
 
             self.visited_history[url] = {
@@ -129,27 +275,78 @@ class HistoryManager:
                 'update_needed': update_needed,
                 'last_db_update': str(last_checked or '')
             }
+        self._history_loaded = True
+        self._rebuild_skip_index()
         self.save_history_csv()
 
+    def _append_history_row(self, url, data):
+        if self._append_fh is None:
+            self._append_fh = open(VISITED_HISTORY_FILE, 'a', newline='', encoding='utf-8')
+            self._append_writer = csv.DictWriter(self._append_fh, fieldnames=VISITED_HISTORY_COLUMNS)
+            # Only instances holding an open handle are registered, and close()
+            # unregisters again, so atexit does not pin every HistoryManager.
+            atexit.register(self.close)
+        self._append_writer.writerow({
+            'profile_url': url,
+            'saved': data.get('saved', 'no'),
+            'visited_at': data.get('visited_at', ''),
+            'update_needed': data.get('update_needed', 'yes'),
+            'last_db_update': data.get('last_db_update', '')
+        })
+        self._append_fh.flush()
+        if self._history_loaded and self._superseded_rows >= self._COMPACT_EVERY:
+            self.save_history_csv()
+
+    def flush(self):
+        if self._append_fh is not None:
+            self._append_fh.flush()
+
+    def close(self):
+        if self._append_fh is None:
+            return
+        atexit.unregister(self.close)
+        try:
+            self._append_fh.close()
+        except Exception as e:
+            logger.debug(f"Could not close visited history handle: {e}")
+        self._append_fh = None
+        self._append_writer = None
+
     def save_history_csv(self):
+        # A full rewrite supersedes anything still buffered for append.
+        self.close()
+        # Stream rows into a sibling temp file and swap it in, so a crash
+        # mid-write never leaves a truncated history behind.
+        tmp_path = VISITED_HISTORY_FILE.with_name(VISITED_HISTORY_FILE.name + '.tmp')
         try:
-            rows = []
-            for url, data in self.visited_history.items():
-                rows.append({
-                    'profile_url': url,
-                    'saved': data.get('saved', 'no'),
-                    'visited_at': data.get('visited_at', ''),
-                    'update_needed': data.get('update_needed', 'yes'),
-                    'last_db_update': data.get('last_db_update', '')
-                })
-            pd.DataFrame(rows).to_csv(VISITED_HISTORY_FILE, index=False)
+            with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(VISITED_HISTORY_COLUMNS)
+                writer.writerows(
+                    (
+                        url,
+                        data.get('saved', 'no'),
+                        data.get('visited_at', ''),
+                        data.get('update_needed', 'yes'),
+                        data.get('last_db_update', ''),
+                    )
+                    for url, data in self.visited_history.items()
+                )
+            os.replace(tmp_path, VISITED_HISTORY_FILE)
+            self._superseded_rows = 0
         except Exception as e:
             logger.error(f"Error saving visited history: {e}")
 
     def mark_as_visited(self, url, saved=False, update_needed=False):
-        url = self._normalize_profile_url(url)
+        url = self._history_key(url)
         if not url:
             return False
+        outcome = (bool(saved), bool(update_needed))
+        recent = self._recent_writes.get(url)
+        if recent is not None:
+            if recent[0] == outcome and time.monotonic() - recent[1] < self._RECENT_WRITE_TTL_SECONDS:
+                return True
+            del self._recent_writes[url]
         try:
             db_saved = save_visited_profile(url, is_unt_alum=bool(saved))  # live DB update
         except Exception as e:
@@ -160,29 +357,38 @@ class HistoryManager:
         
         now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
+        if url in self.visited_history:
+            self._superseded_rows += 1
         self.visited_history[url] = {
             'saved': 'yes' if saved else 'no',
             'visited_at': now_str,
             'update_needed': 'yes' if update_needed else 'no',
             'last_db_update': now_str  # Update with current time as we just synced to DB
         }
-        self.save_history_csv()
+        if self._is_skip_entry(self.visited_history[url]):
+            self._skip_urls.add(url)
+        else:
+            self._skip_urls.discard(url)
+        try:
+            self._append_history_row(url, self.visited_history[url])
+        except Exception as e:
+            logger.error(f"Error saving visited history: {e}")
+        if db_saved:
+            self._recent_writes[url] = (outcome, time.monotonic())
+            # Oldest first by insertion order, since entries are re-inserted on rewrite.
+            if len(self._recent_writes) > self._RECENT_WRITE_MAX:
+                self._recent_writes.pop(next(iter(self._recent_writes)))
         return bool(db_saved)
 
     def should_skip(self, url):
         url = self._normalize_profile_url(url)
         if not url:
             return False
-        if url not in self.visited_history: return False
-        entry = self.visited_history[url]
-        saved = entry.get('saved', 'no').lower()
-        update_needed = entry.get('update_needed', 'no').lower()
-        
-        if saved == 'yes' and update_needed == 'yes':
+        if url in self._skip_urls:
+            return True
+        if url in self.visited_history:
             logger.info("    🔄 Re-visiting UNT alum (update needed)")
-            return False
-        if saved == 'yes': return True
-        return True
+        return False
 
 def normalize_text(text):
     """
@@ -357,12 +563,22 @@ def ensure_alumni_output_csv(csv_path: Optional[Path] = None):
     """
     target = csv_path if csv_path is not None else OUTPUT_CSV
     target.parent.mkdir(parents=True, exist_ok=True)
+    _close_csv_append_handle(target)
 
     if not target.exists():
         pd.DataFrame(columns=CSV_COLUMNS).to_csv(target, index=False, encoding="utf-8")
         logger.info("📄 Created alumni CSV with canonical columns: %s", target)
         return
 
+    # Happy path: the header already matches, so there is nothing to migrate and
+    # no reason to parse every row into a DataFrame.
+    try:
+        with open(target, "r", newline="", encoding="utf-8") as f:
+            if next(csv.reader(f), None) == CSV_COLUMNS:
+                return
+    except Exception:
+        pass
+
     try:
         existing = pd.read_csv(target, encoding="utf-8")
     except Exception as e:
@@ -475,6 +691,171 @@ def flag_profile_for_review(profile_data):
     except Exception as e:
         logger.warning(f"Could not flag profile: {e}")
 
+# linkedin_url values already present in the alumni CSV, keyed by resolved path.
+# Each entry also records the file's (mtime_ns, size) after our last write so an
+# external rewrite (dead-URL cleanup, redirect canonicalization) forces a reload.
+_saved_url_index = {}
+
+
+@lru_cache(maxsize=32)
+def _csv_key(csv_file) -> str:
+    """Resolved-path key for the per-file caches; resolve() costs syscalls, so memoize it."""
+    return str(Path(csv_file).resolve())
+
+
+def _csv_file_state(csv_file: Path):
+    try:
+        st = os.stat(csv_file)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _saved_urls_for(csv_file: Path) -> set:
+    """Return the set of URLs stored in ``csv_file``, reading it only when it changed on disk."""
+    key = _csv_key(csv_file)
+    entry = _saved_url_index.get(key)
+    if entry is not None and entry["state"] == _csv_file_state(csv_file):
+        return entry["urls"]
+
+    ensure_alumni_output_csv(csv_file)
+    urls = set()
+    try:
+        with open(csv_file, "r", newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            # Only the URL column matters here; skip building a dict per row.
+            idx = header.index("linkedin_url")
+            for row in reader:
+                if len(row) > idx:
+                    url = row[idx].strip().rstrip("/")
+                    if url:
+                        urls.add(url)
+    except Exception as e:
+        logger.warning("⚠️ Could not index existing alumni CSV URLs (%s).", e)
+    _saved_url_index[key] = {"urls": urls, "state": _csv_file_state(csv_file)}
+    return urls
+
+
+def _remember_csv_write(csv_file: Path, url: str = ""):
+    """Record our own write so the next save does not treat it as an external change."""
+    entry = _saved_url_index.get(_csv_key(csv_file))
+    if entry is None:
+        return
+    if url:
+        entry["urls"].add(url)
+    entry["state"] = _csv_file_state(csv_file)
+
+
+# Persistent append handles for the alumni CSV, keyed by resolved path, so a
+# new profile is one buffered write instead of an open/close per save.
+_csv_append_handles = {}
+
+
+def _close_csv_append_handle(csv_file: Optional[Path] = None):
+    """Close the append handle for ``csv_file`` (or all of them) before a full rewrite."""
+    keys = list(_csv_append_handles) if csv_file is None else [_csv_key(csv_file)]
+    for key in keys:
+        handle = _csv_append_handles.pop(key, None)
+        if handle is None:
+            continue
+        try:
+            handle[0].close()
+        except Exception as e:
+            logger.debug(f"Could not close alumni CSV append handle: {e}")
+
+
+atexit.register(_close_csv_append_handle)
+
+
+def _append_csv_row(csv_file: Path, save_data: dict):
+    key = _csv_key(csv_file)
+    handle = _csv_append_handles.get(key)
+    if handle is None:
+        fh = open(csv_file, "a", newline="", encoding="utf-8", buffering=1 << 16)
+        # "\n" like the pandas rewrites of this file, so it never mixes endings.
+        handle = (fh, csv.writer(fh, lineterminator="\n"))
+        _csv_append_handles[key] = handle
+    fh, writer = handle
+    # A plain list in CSV_COLUMNS order; no per-save dict or DictWriter lookup.
+    writer.writerow(["" if save_data.get(col) is None else save_data.get(col) for col in CSV_COLUMNS])
+    # Flush per row: other readers (and the change detection above) see it at
+    # once. The advisory lock keeps a concurrent scraper from interleaving rows.
+    if fcntl is not None:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        try:
+            fh.flush()
+        finally:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+    else:
+        fh.flush()
+
+
+def _rewrite_csv_with_row(csv_file: Path, save_data: dict):
+    """Replace an existing profile row by streaming the CSV into a new file (re-scrapes only)."""
+    _close_csv_append_handle(csv_file)
+    csv_file = Path(csv_file)
+    url = save_data['linkedin_url']
+    tmp_file = csv_file.with_name(csv_file.name + ".tmp")
+    with open(csv_file, "r", newline="", encoding="utf-8") as f:
+        header_ok = next(csv.reader(f), None) == CSV_COLUMNS
+    # Repair only once the read handle is closed (Windows cannot rewrite an open file).
+    if not header_ok:
+        ensure_alumni_output_csv(csv_file)
+    # Rows are copied as raw strings (no DataFrame parse/serialize); the
+    # caller already knows this URL is stored, so its old row(s) are dropped
+    # by key and the fresh row goes last (same result as keep='last').
+    with open(csv_file, "r", newline="", encoding="utf-8") as src, \
+            open(tmp_file, "w", newline="", encoding="utf-8") as dst:
+        reader = csv.reader(src)
+        next(reader, None)
+        writer = csv.writer(dst, lineterminator="\n")
+        writer.writerow(CSV_COLUMNS)
+        idx = CSV_COLUMNS.index('linkedin_url')
+        for row in reader:
+            if len(row) > idx and row[idx].strip().rstrip('/') == url:
+                continue
+            writer.writerow(row)
+        writer.writerow(["" if save_data.get(col) is None else save_data.get(col) for col in CSV_COLUMNS])
+    os.replace(tmp_file, csv_file)
+
+
+def compact_alumni_output_csv(csv_path: Optional[Path] = None):
+    """
+    End-of-run cleanup for the append-only alumni CSV.
+
+    Per-save writes only touch the new row, so the retroactive grad_year /
+    school_start normalization and URL dedupe run here once per run instead.
+    """
+    target = csv_path if csv_path is not None else OUTPUT_CSV
+    _close_csv_append_handle(target)
+    if not target.exists():
+        return
+    try:
+        df = pd.read_csv(target, encoding="utf-8")
+        if list(df.columns) != CSV_COLUMNS or df.empty:
+            return
+        before = len(df)
+        # Dedupe on the URL key alone; saves never append a stored URL, so the
+        # common case has no duplicates and skips the filtered copy entirely.
+        url_key = df['linkedin_url'].astype(str).str.strip().str.rstrip('/')
+        dupes = url_key.duplicated(keep='last')
+        if dupes.any():
+            df = df.loc[~dupes].copy()
+        df['grad_year'] = df['grad_year'].apply(normalize_grad_year)
+        df = _normalize_dataframe_primary_education_dates(df)
+        df['grad_year'] = df['grad_year'].apply(lambda y: '' if y is None or pd.isna(y) else int(y))
+        df['school_start'] = df['school_start'].apply(
+            lambda v: '' if v is None or (isinstance(v, float) and pd.isna(v)) else v
+        )
+        df.to_csv(target, index=False, encoding='utf-8')
+        _remember_csv_write(target)
+        if len(df) != before:
+            logger.info("🧹 Alumni CSV compacted: removed %s duplicate row(s).", before - len(df))
+    except Exception as e:
+        logger.warning(f"⚠️ Could not compact alumni CSV: {e}")
+
+
 def save_profile_to_csv(profile_data):
     try:
         if not profile_data.get('profile_url') or not profile_data.get('name'):
@@ -483,29 +864,14 @@ def save_profile_to_csv(profile_data):
 
         # Block fake/placeholder profiles
         if is_blocked_url(profile_data.get('profile_url', '')):
-            logger.info(f"🚫 Blocked profile skipped: {profile_data.get('profile_url')}")
+            logger.info("🚫 Blocked profile skipped: %s", profile_data.get('profile_url'))
             return False
         
-        has_data = any([profile_data.get(k) for k in ['headline', 'location', 'job_title', 'school', 'education']])
+        has_data = any(profile_data.get(k) for k in ('headline', 'location', 'job_title', 'school', 'education'))
         if not has_data:
             logger.warning("⚠️ Profile save skipped (no usable data fields): %s", profile_data.get('profile_url', '?'))
             return False
 
-        ensure_alumni_output_csv()
-        try:
-            existing_df = pd.read_csv(OUTPUT_CSV, encoding="utf-8")
-        except Exception as e:
-            logger.warning("⚠️ Read failed after ensure (%s). Using empty frame.", e)
-            existing_df = pd.DataFrame(columns=CSV_COLUMNS)
-        if list(existing_df.columns) != CSV_COLUMNS:
-            ensure_alumni_output_csv()
-            existing_df = pd.read_csv(OUTPUT_CSV, encoding="utf-8")
-
-        # Retroactive cleanup for existing CSV content.
-        if 'grad_year' in existing_df.columns:
-            existing_df['grad_year'] = existing_df['grad_year'].apply(normalize_grad_year)
-        existing_df = _normalize_dataframe_primary_education_dates(existing_df)
-        
         # Transform data to new schema
         name = str(profile_data.get('name', '')).strip()
         parts = name.split()
@@ -584,41 +950,32 @@ def save_profile_to_csv(profile_data):
             if field in save_data and save_data[field]:
                 save_data[field] = normalize_text(str(save_data[field]))
         
+        # Run experience analysis (relevance scoring + seniority detection) before
+        # the write so its columns go out with the row instead of a second
+        # read/rewrite of the whole CSV afterwards.
+        analysis_data = _run_experience_analysis_on_profile(profile_data) or {}
+        for key, value in analysis_data.items():
+            if key in CSV_COLUMNS:
+                save_data[key] = value
+
         # Ensure all columns exist
         for col in CSV_COLUMNS:
             save_data.setdefault(col, "")
             
-        new_row = pd.DataFrame([save_data])[CSV_COLUMNS]
-        combined_df = existing_df.reindex(columns=CSV_COLUMNS).copy()
-        if combined_df.empty:
-            combined_df = new_row.copy()
+        # New profiles are appended as a single row; only re-scrapes of a URL
+        # already in the CSV pay for the full read/dedupe/rewrite.
+        saved_urls = _saved_urls_for(OUTPUT_CSV)
+        url = save_data['linkedin_url']
+        if url in saved_urls:
+            _rewrite_csv_with_row(OUTPUT_CSV, save_data)
         else:
-            # Build from records to avoid pandas concat/append dtype deprecation warnings.
-            records = combined_df.to_dict(orient='records')
-            records.append(new_row.iloc[0].to_dict())
-            combined_df = pd.DataFrame.from_records(records, columns=CSV_COLUMNS)
-        combined_df = combined_df.drop_duplicates(subset=['linkedin_url'], keep='last')
-
-        if 'grad_year' in combined_df.columns:
-            combined_df['grad_year'] = combined_df['grad_year'].apply(normalize_grad_year)
-            combined_df = _normalize_dataframe_primary_education_dates(combined_df)
-            combined_df['grad_year'] = combined_df['grad_year'].apply(
-                lambda y: '' if y is None or pd.isna(y) else int(y)
-            )
-        if 'school_start' in combined_df.columns:
-            combined_df['school_start'] = combined_df['school_start'].apply(
-                lambda v: '' if v is None or (isinstance(v, float) and pd.isna(v)) else v
-            )
-        
-        combined_df.to_csv(OUTPUT_CSV, index=False, encoding='utf-8')
+            _append_csv_row(OUTPUT_CSV, save_data)
+        _remember_csv_write(OUTPUT_CSV, url)
         
         # Flag profiles with incomplete data for review
         # Note: flag_profile_for_review still expects original keys, so pass original profile_data
         flag_profile_for_review(profile_data)
         
-        # Run experience analysis (relevance scoring + seniority detection)
-        _run_experience_analysis_on_profile(profile_data)
-        
         return True
     except Exception as e:
         logger.error(f"❌ Error saving profile: {e}")
@@ -627,14 +984,14 @@ def save_profile_to_csv(profile_data):
 
 def _run_experience_analysis_on_profile(profile_data):
     """
-    Run relevance scoring and seniority detection on a newly saved profile.
-    Updates the CSV row with computed values.
+    Run relevance scoring and seniority detection on a profile about to be saved.
+    Returns the computed CSV column values (empty dict when unavailable).
     """
     try:
         from relevance_scorer import analyze_profile_relevance, is_groq_available
         from seniority_detector import analyze_seniority
     except ImportError:
-        return  # Modules not available, skip silently
+        return {}  # Modules not available, skip silently
     
     try:
         # Relevance scoring (requires Groq)
@@ -646,40 +1003,7 @@ def _run_experience_analysis_on_profile(profile_data):
         experience_months = relevance.get('relevant_experience_months')
         seniority = analyze_seniority(profile_data, experience_months)
         
-        # Update CSV if we computed anything
-        analysis_data = {**relevance, 'seniority_level': seniority}
-        if analysis_data:
-            _update_csv_row(profile_data.get('profile_url', ''), analysis_data)
+        return {**relevance, 'seniority_level': seniority}
     except Exception as e:
         logger.debug(f"Experience analysis skipped for profile: {e}")
-
-
-def _update_csv_row(profile_url, analysis_data):
-    """Update a specific row in the CSV with analysis results."""
-    if not profile_url or not analysis_data:
-        return
-    
-    try:
-        ensure_alumni_output_csv()
-        df = pd.read_csv(OUTPUT_CSV, encoding="utf-8")
-        if list(df.columns) != CSV_COLUMNS:
-            ensure_alumni_output_csv()
-            df = pd.read_csv(OUTPUT_CSV, encoding="utf-8")
-        url = str(profile_url).strip().rstrip('/')
-        
-        mask = df["linkedin_url"].astype(str).str.strip().str.rstrip("/") == url
-        if not mask.any():
-            return
-
-        for key in analysis_data:
-            if key in df.columns:
-                df[key] = df[key].astype(object)
-
-        for key, value in analysis_data.items():
-            if key in df.columns:
-                df.loc[mask, key] = value
-        
-        df.to_csv(OUTPUT_CSV, index=False, encoding='utf-8')
-    except Exception as e:
-        logger.debug(f"Could not update CSV row with analysis data: {e}")
-
+        return {}
@@ -64,6 +64,10 @@ NON_ENGINEERING_DEGREE_KEYWORDS = [
     "law", "communications", "journalism", "kinesiology", "biology", 
     "chemistry", "physics" 
 ]
+# All kill-list words as one word-bounded alternation (one scan per text).
+_NON_ENGINEERING_DEGREE_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(kw) for kw in sorted(NON_ENGINEERING_DEGREE_KEYWORDS, key=len, reverse=True)) + r")\b"
+)
 
 DISCIPLINES = [
     # 1. SOFTWARE, DATA & AI ENGINEERING
@@ -177,6 +181,11 @@ _ENGINEERING_SIGNAL_KEYWORDS = sorted(
         if len(kw) > 2
     }
 )
+# Substring alternation over the same keywords: one regex scan instead of a
+# Python-level `in` test per keyword.
+_ENGINEERING_SIGNAL_RE = re.compile(
+    "|".join(re.escape(kw) for kw in sorted(_ENGINEERING_SIGNAL_KEYWORDS, key=len, reverse=True))
+)
 
 
 def _coerce_llm_discipline_choice(payload: dict | None) -> str:
@@ -214,7 +223,7 @@ def _has_engineering_signal(text_lower: str) -> bool:
         return False
     if " engineering" in f" {text_lower}" or "engineer" in text_lower:
         return True
-    return any(kw in text_lower for kw in _ENGINEERING_SIGNAL_KEYWORDS)
+    return _ENGINEERING_SIGNAL_RE.search(text_lower) is not None
 
 
 def _infer_discipline_with_llm(text: str, job_title_unused: str = "", headline_unused: str = "") -> str:
@@ -324,11 +333,10 @@ def _classify_text(text: str, current_priority: str, use_llm: bool = True) -> st
         return "Software, Data, AI & Cybersecurity"
 
     # 3. Non-engineering kill list (before LLM to avoid false positive guesses)
-    for non_eng_kw in NON_ENGINEERING_DEGREE_KEYWORDS:
-        if re.search(r'\b' + re.escape(non_eng_kw) + r'\b', text_lower):
-            if non_eng_kw == "biology" and ("computational biology" in text_lower or "bioinformatics" in text_lower):
-                continue
-            return "Other"
+    for match in _NON_ENGINEERING_DEGREE_RE.finditer(text_lower):
+        if match.group(0) == "biology" and ("computational biology" in text_lower or "bioinformatics" in text_lower):
+            continue
+        return "Other"
 
     # 4. Search for all approved disciplines
     matches = []
@@ -353,12 +361,14 @@ def _classify_text(text: str, current_priority: str, use_llm: bool = True) -> st
     return "Other"
 
 
+_UNT_SCHOOL_NAME_RE = re.compile(r"university of north texas|\bunt\b", re.IGNORECASE)
+
+
 def _is_unt_school_name(school_name: str) -> bool:
     """Return True when school string appears to be UNT."""
-    text = (school_name or "").strip().lower()
-    if not text:
+    if not school_name:
         return False
-    return ("university of north texas" in text) or bool(re.search(r"\bunt\b", text))
+    return bool(_UNT_SCHOOL_NAME_RE.search(school_name))
 
 
 def _degree_rank(value: str) -> int:
@@ -12,6 +12,7 @@ import os
 import re
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 from settings import logger
@@ -164,6 +165,13 @@ class EntityClassifier:
             r'Coach|Evaluator|Busser|Assembler|Technician|Banker|Shopper)\b',
             re.I
         )
+        # company_hints and title_hints fused into one scan; the named group
+        # that matched says which hint it was. Company alternatives come first
+        # so "Co-Founder" still reports "Co" (and "Founder" the title).
+        self.role_hints = re.compile(
+            rf'(?P<company>{self.company_hints.pattern})|(?P<title>{self.title_hints.pattern})',
+            re.I
+        )
         
         # Location patterns - countries, US states, common cities, and location keywords
         self.location_patterns = re.compile(
@@ -226,6 +234,86 @@ class EntityClassifier:
 
         # Location character blacklist (requested by user)
         self.location_char_blacklist = re.compile(r"['\(\)]")
+
+        # is_location() lookups, built once instead of on every call.
+        # Substring semantics (matches "kw in text"), hence no word boundaries.
+        self.location_keyword_blacklist = re.compile(
+            r'university|college|foundation|institute|school|solutions|technologies',
+            re.I
+        )
+        # Texts that are a location on their own (compared lowercased, whole string)
+        self.pure_locations = frozenset([
+            "remote", "hybrid", "on-site", "onsite",
+            "united states", "usa", "india", "canada", "uk", "united kingdom",
+            "germany", "australia", "france", "japan", "china", "brazil", "mexico",
+            "saudi arabia", "uae", "united arab emirates", "qatar", "kuwait",
+            "bahrain", "oman", "jordan", "egypt", "turkey", "pakistan",
+            "malaysia", "singapore", "indonesia", "philippines", "vietnam",
+            "thailand", "south korea", "korea", "taiwan",
+            "nigeria", "kenya", "ghana", "south africa", "ethiopia",
+            "italy", "spain", "netherlands", "belgium", "switzerland",
+            "sweden", "norway", "denmark", "finland", "poland",
+            "ireland", "new zealand", "portugal", "greece",
+            # Metro areas and common LinkedIn location formats
+            "dallas-fort worth metroplex", "dfw metroplex",
+            "greater houston", "greater houston area",
+            "greater dallas area", "greater dallas-fort worth area",
+            "greater austin area", "greater san antonio area",
+            "bay area", "san francisco bay area", "sf bay area",
+            "greater seattle area", "greater seattle metropolitan area",
+            "greater los angeles area", "greater la area",
+            "greater new york city area", "greater nyc area", "new york metropolitan area",
+            "new york city metropolitan area",
+            "greater boston area", "greater boston",
+            "greater chicago area", "chicagoland",
+            "greater denver area", "greater denver metropolitan area",
+            "greater atlanta area", "greater atlanta",
+            "greater phoenix area", "greater phoenix metropolitan area",
+            "greater miami area", "south florida",
+            "greater philadelphia area", "greater philadelphia",
+            "greater detroit area", "greater detroit metropolitan area",
+            "greater minneapolis area", "twin cities", "twin cities area",
+            "greater washington area", "washington dc metro area",
+            "washington d.c. metro area", "dc metro area",
+            "greater charlotte area", "greater nashville area",
+            "greater portland area", "greater tampa area",
+            "greater orlando area", "greater raleigh area",
+            "greater indianapolis area", "greater columbus area",
+            "greater pittsburgh area", "greater st. louis area",
+            "greater kansas city area", "greater san diego area",
+            "research triangle", "research triangle area",
+            "silicon valley",
+            "inland empire", "inland empire area",
+            "puget sound", "puget sound area",
+            "hampton roads", "hampton roads area",
+        ])
+        # Last words that settle a company-vs-title tie in favour of the title.
+        self.title_tail_words = frozenset([
+            "engineer", "developer", "manager", "analyst",
+            "designer", "specialist", "associate", "intern",
+            "coordinator", "administrator", "architect",
+            "scientist", "professor", "teacher", "assistant",
+            "student", "trainee", "researcher", "technician",
+            "programmer", "tester", "agent", "staff", "officer",
+            "cashier", "server", "barista", "clerk", "attendant",
+            "recruiter", "supervisor", "director", "lead",
+            "coach", "evaluator", "busser", "assembler", "banker",
+            "shopper",
+        ])
+        self.regional_qualifiers = re.compile(
+            r'\b(metro|area|region|county|metroplex|metropolitan|bay|greater|'
+            r'north|south|east|west|northern|southern|eastern|western|central|'
+            r'tri-state|valley|coast|inland|peninsula)\b',
+            re.I
+        )
+        # is_location's positive shape checks as one match: "City, State[, Country]"
+        # (case-sensitive), a metro/regional name, or a text that is entirely a
+        # location keyword. Each branch keeps its original flags.
+        self.location_shape_pattern = re.compile(
+            rf'(?:{self.city_state_pattern.pattern})'
+            rf'|(?i:{self.metro_area_pattern.pattern})'
+            rf'|(?i:(?:{self.location_patterns.pattern})\Z)'
+        )
     
     def _load_company_database(self):
         """Load curated company database from JSON file."""
@@ -253,23 +341,25 @@ class EntityClassifier:
             return ("unknown", 0.0)
         
         clean_text = text.strip()
+        # Lowercased once here and handed to every tier below.
+        text_lower = clean_text.lower()
         
         # Quick location check first (to filter out obvious locations)
         if self._is_obvious_location(clean_text):
             return ("location", 0.95)
         
         # --- Tier 1: Database Lookup ---
-        result = self._tier1_database_lookup(clean_text)
+        result = self._tier1_database_lookup(clean_text, text_lower)
         if result:
             return result
         
         # --- Tier 2: spaCy NER ---
-        result = self._tier2_spacy_ner(clean_text)
+        result = self._tier2_spacy_ner(clean_text, text_lower)
         if result:
             return result
         
         # --- Tier 3: Regex Heuristics ---
-        return self._tier3_regex_heuristics(clean_text)
+        return self._tier3_regex_heuristics(clean_text, text_lower)
     
     def _is_obvious_location(self, text: str) -> bool:
         """Quick check for obvious location patterns."""
@@ -307,9 +397,10 @@ class EntityClassifier:
                 return True
         return False
     
-    def _tier1_database_lookup(self, text: str) -> Optional[Tuple[str, float]]:
+    def _tier1_database_lookup(self, text: str, text_lower: Optional[str] = None) -> Optional[Tuple[str, float]]:
         """Check against curated company/university database."""
-        text_lower = text.lower().strip()
+        if text_lower is None:
+            text_lower = text.lower().strip()
         
         # Direct company match
         if text_lower in self.companies_db:
@@ -348,13 +439,23 @@ class EntityClassifier:
         
         return None
     
-    def _tier2_spacy_ner(self, text: str) -> Optional[Tuple[str, float]]:
+    def _tier2_spacy_ner(self, text: str, text_lower: Optional[str] = None) -> Optional[Tuple[str, float]]:
         """Use spaCy NER to classify entities."""
         nlp = _get_nlp_nonblocking()
         if not nlp or not callable(nlp):
             return None
         
         doc = nlp(text)
+        if text_lower is None:
+            text_lower = text.lower()
+        lower_words = text_lower.split()
+        # Word-level views of the text, shared by every ORG entity below.
+        last_word = lower_words[-1] if lower_words else ""
+        # A bare "-" or "/" last token splits to nothing (e.g. "Acme Corp -").
+        last_parts = last_word.replace('/', ' ').replace('-', ' ').split()
+        clean_last = last_parts[-1] if last_parts else ""
+        slash_split_words = text_lower.replace('/', ' ').split()
+        first_word = lower_words[0] if lower_words else ""
         
         # Common job title ending words that spaCy sometimes misclassifies as ORG
         job_title_endings = {"engineer", "developer", "manager", "director", "analyst",
@@ -373,26 +474,20 @@ class EntityClassifier:
         for ent in doc.ents:
             if ent.label_ == "ORG":
                 # Check if this looks like a job title
-                # 1. Last word check (e.g. "Software Engineer")
-                last_word = text.split()[-1].lower() if text.split() else ""
-                
-                # Handle slashes/punctuation in last word (e.g. "Co-op/Intern")
-                clean_last = last_word.replace('/', ' ').replace('-', ' ').split()[-1] if last_word else ""
-                
+                # 1. Last word check (e.g. "Software Engineer"), with slashes/
+                # punctuation in the last word handled (e.g. "Co-op/Intern")
                 if last_word in job_title_endings or clean_last in job_title_endings:
                     return ("job_title", 0.7)  # Override spaCy's ORG classification
                 
                 # 2. Strong keyword check - if IT CONTAINS "Intern", "Co-op", "Student" it is likely a title
                 # even if SpaCy thinks it's an ORG (e.g. "Engineering Intern")
-                text_lower = text.lower()
                 strong_title_indicators = {"intern", "co-op", "student", "fellow", "trainee", "assistant"}
-                if any(ind in text_lower.split() or ind in text_lower.replace('/', ' ').split() for ind in strong_title_indicators):
+                if any(ind in lower_words or ind in slash_split_words for ind in strong_title_indicators):
                      return ("job_title", 0.75)
                 
                 # 3. Check for strong title prefixes (Director of, Head of, VP of, Chief)
                 # "Director of Software Engineering" -> SpaCy calls it ORG, but it's a title
                 strong_prefixes = {"director", "head", "vp", "vice president", "chief", "senior", "principal", "lead", "sr", "jr", "sr.", "jr.", "exec", "executive", "managing", "general"}
-                first_word = text_lower.split()[0] if text_lower.split() else ""
                 if first_word in strong_prefixes:
                     return ("job_title", 0.75)
                 
@@ -408,7 +503,19 @@ class EntityClassifier:
         
         return None
     
-    def _tier3_regex_heuristics(self, text: str) -> Tuple[str, float]:
+    def _role_hints(self, text: str) -> Tuple[bool, bool]:
+        """Return (has_company_hint, has_title_hint) from a single regex scan."""
+        has_company = has_title = False
+        for match in self.role_hints.finditer(text):
+            if match.group("company") is not None:
+                has_company = True
+            else:
+                has_title = True
+            if has_company and has_title:
+                break
+        return has_company, has_title
+
+    def _tier3_regex_heuristics(self, text: str, text_lower: Optional[str] = None) -> Tuple[str, float]:
         """Fall back to regex pattern matching."""
         
         # Check for location patterns
@@ -419,11 +526,11 @@ class EntityClassifier:
             # Could still be part of a company name, lower confidence
             # e.g., "Texas Instruments" has "Texas" but is a company
         
-        has_company_hint = bool(self.company_hints.search(text))
-        has_title_hint = bool(self.title_hints.search(text))
+        has_company_hint, has_title_hint = self._role_hints(text)
         
         # Check for university keywords
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         has_university_hint = any(kw in text_lower for kw in ["university", "college", "school of", "institute of"])
         
         if has_university_hint:
@@ -458,16 +565,7 @@ class EntityClassifier:
         elif has_company_hint and has_title_hint:
             # Both match - prefer title if it ends with a title word
             # e.g., "Project Engineer" ends with "Engineer" which is a title
-            if text.split()[-1].lower() in ["engineer", "developer", "manager", "analyst", 
-                                             "designer", "specialist", "associate", "intern",
-                                             "coordinator", "administrator", "architect",
-                                             "scientist", "professor", "teacher", "assistant",
-                                             "student", "trainee", "researcher", "technician",
-                                             "programmer", "tester", "agent", "staff", "officer",
-                                             "cashier", "server", "barista", "clerk", "attendant",
-                                             "recruiter", "supervisor", "manager", "director", "lead",
-                                             "coach", "evaluator", "busser", "assembler", "banker",
-                                             "shopper"]:
+            if text_lower.split()[-1] in self.title_tail_words:
                 return ("job_title", 0.5)
             return ("unknown", 0.3)
         
@@ -483,14 +581,19 @@ class EntityClassifier:
         
         text_clean = text.strip()
         text_lower = text_clean.lower()
+
+        # Exact hits ("United States", "Remote", metro names) are the common
+        # case and none of them trip the rejects below, so a single set lookup
+        # settles them before any regex scan or comma count.
+        if text_lower in self.pure_locations:
+            return True
         
         # 1. Reject if contains blacklisted characters: () or '
         if self.location_char_blacklist.search(text_clean):
             return False
             
         # 2. Reject if contains university/foundation keywords (unless it's a known location name like "University Park" - rare for alumni)
-        location_keyword_blacklist = ["university", "college", "foundation", "institute", "school", "solutions", "technologies"]
-        if any(kw in text_lower for kw in location_keyword_blacklist):
+        if self.location_keyword_blacklist.search(text_clean):
             # Exception for specific metroplex areas if needed
             return False
 
@@ -505,67 +608,10 @@ class EntityClassifier:
         if comma_count > 2:
             return False
 
-        # 5. "City, State/Country" pattern
-        if self.city_state_pattern.match(text_clean):
-            return True
-        
-        # 6. Metro area patterns without commas
-        # Catches "San Francisco Bay Area", "Greater Houston", "Dallas-Fort Worth Metroplex", etc.
-        if self.metro_area_pattern.match(text_clean):
-            return True
-
-        # 7. Check location keywords with high specificity
-        # Only return True if the ENTIRE text is a location
-        pure_locations = [
-            "remote", "hybrid", "on-site", "onsite",
-            "united states", "usa", "india", "canada", "uk", "united kingdom",
-            "germany", "australia", "france", "japan", "china", "brazil", "mexico",
-            "saudi arabia", "uae", "united arab emirates", "qatar", "kuwait",
-            "bahrain", "oman", "jordan", "egypt", "turkey", "pakistan",
-            "malaysia", "singapore", "indonesia", "philippines", "vietnam",
-            "thailand", "south korea", "korea", "taiwan",
-            "nigeria", "kenya", "ghana", "south africa", "ethiopia",
-            "italy", "spain", "netherlands", "belgium", "switzerland",
-            "sweden", "norway", "denmark", "finland", "poland",
-            "ireland", "new zealand", "portugal", "greece",
-            # Metro areas and common LinkedIn location formats
-            "dallas-fort worth metroplex", "dfw metroplex",
-            "greater houston", "greater houston area",
-            "greater dallas area", "greater dallas-fort worth area",
-            "greater austin area", "greater san antonio area",
-            "bay area", "san francisco bay area", "sf bay area",
-            "greater seattle area", "greater seattle metropolitan area",
-            "greater los angeles area", "greater la area",
-            "greater new york city area", "greater nyc area", "new york metropolitan area",
-            "new york city metropolitan area",
-            "greater boston area", "greater boston",
-            "greater chicago area", "chicagoland",
-            "greater denver area", "greater denver metropolitan area",
-            "greater atlanta area", "greater atlanta",
-            "greater phoenix area", "greater phoenix metropolitan area",
-            "greater miami area", "south florida",
-            "greater philadelphia area", "greater philadelphia",
-            "greater detroit area", "greater detroit metropolitan area",
-            "greater minneapolis area", "twin cities", "twin cities area",
-            "greater washington area", "washington dc metro area",
-            "washington d.c. metro area", "dc metro area",
-            "greater charlotte area", "greater nashville area",
-            "greater portland area", "greater tampa area",
-            "greater orlando area", "greater raleigh area",
-            "greater indianapolis area", "greater columbus area",
-            "greater pittsburgh area", "greater st. louis area",
-            "greater kansas city area", "greater san diego area",
-            "research triangle", "research triangle area",
-            "silicon valley",
-            "inland empire", "inland empire area",
-            "puget sound", "puget sound area",
-            "hampton roads", "hampton roads area",
-        ]
-        if text_lower in pure_locations:
-            return True
-            
-        # 8. Check if it matches US States or common cities exactly
-        if self.location_patterns.fullmatch(text_clean):
+        # 5-8. One pass over the positive shapes: "City, State/Country", metro
+        # areas without commas ("San Francisco Bay Area", "Greater Houston",
+        # "Dallas-Fort Worth Metroplex"), or an exact US state / common city.
+        if self.location_shape_pattern.match(text_clean):
             return True
 
         # 9. Broader check: if the text contains location keywords AND looks
@@ -574,15 +620,9 @@ class EntityClassifier:
         words = text_clean.split()
         if len(words) <= 6 and self.location_patterns.search(text_clean):
             # Make sure it doesn't look like a company or title
-            if not self.company_hints.search(text_clean) and not self.title_hints.search(text_clean):
+            if not any(self._role_hints(text_clean)):
                 # Check for regional qualifiers that strongly indicate location
-                regional_qualifiers = re.compile(
-                    r'\b(metro|area|region|county|metroplex|metropolitan|bay|greater|'  
-                    r'north|south|east|west|northern|southern|eastern|western|central|'  
-                    r'tri-state|valley|coast|inland|peninsula)\b',
-                    re.I
-                )
-                if regional_qualifiers.search(text_clean):
+                if self.regional_qualifiers.search(text_clean):
                     return True
 
         return False
@@ -629,19 +669,25 @@ def get_classifier() -> EntityClassifier:
     global _classifier
     if _classifier is None:
         _classifier = EntityClassifier()
+        # Memoized verdicts belong to the instance that produced them.
+        for cached in (classify_entity, is_location, is_university):
+            cached.cache_clear()
     return _classifier
 
 
+@lru_cache(maxsize=4096)
 def classify_entity(text: str) -> Tuple[str, float]:
-    """Convenience function to classify a single entity."""
+    """Convenience function to classify a single entity (memoized per string)."""
     return get_classifier().classify(text)
 
 
+@lru_cache(maxsize=4096)
 def is_location(text: str) -> bool:
-    """Convenience function to check if text is a location."""
+    """Convenience function to check if text is a location (memoized per string)."""
     return get_classifier().is_location(text)
 
 
+@lru_cache(maxsize=4096)
 def is_university(text: str) -> bool:
-    """Convenience function to check if text is a university."""
+    """Convenience function to check if text is a university (memoized per string)."""
     return get_classifier().is_university(text)
@@ -64,10 +64,25 @@ except ImportError:
 
 try:
     from bs4 import BeautifulSoup
+    import soupsieve
     BS4_AVAILABLE = True
 except ImportError:
     BS4_AVAILABLE = False
 
+# Compiled class filters for HTML cleaning. [class*=...] matches substrings of the
+# class attribute, and soupsieve evaluates them without a Python callback per element.
+if BS4_AVAILABLE:
+    NOISE_CLASS_SELECTOR = soupsieve.compile(
+        "[class*='visually-hidden'], [class*='inline-show-more-text'], [class*='artdeco-button__icon']"
+    )
+    # Diamond-icon skill/tag rows inside .pvs-entity__sub-components.
+    SKILL_TAG_CONTAINER_SELECTOR = soupsieve.compile(
+        "div[class*='t-14'][class*='t-normal'][class*='t-black']:not([class*='t-black--light'])"
+    )
+else:
+    NOISE_CLASS_SELECTOR = None
+    SKILL_TAG_CONTAINER_SELECTOR = None
+
 # Configuration
 GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
 GROQ_ENABLED = os.getenv("USE_GROQ", "true").lower() == "true"
@@ -389,12 +404,21 @@ def strip_noise_elements(soup):
     for tag in soup.find_all(['script', 'style', 'svg', 'img', 'iframe', 'noscript']):
         tag.decompose()
     # Remove visually hidden and show-more elements
-    for tag in soup.find_all(class_=lambda x: x and any(
-        c in x for c in ['visually-hidden', 'inline-show-more-text', 'artdeco-button__icon']
-    )):
+    for tag in NOISE_CLASS_SELECTOR.select(soup):
         tag.decompose()
 
 
+def is_skill_summary_text(txt: str) -> bool:
+    """
+    True for LinkedIn skill roll-up lines such as "Python, SQL and +4 skills".
+    Lowercases at most once, and only for texts containing "+" or ",".
+    """
+    if "+" not in txt and "," not in txt:
+        return False
+    txt_lower = txt.lower()
+    return ("skill" in txt_lower and "+" in txt) or "skills" in txt_lower
+
+
 def verify_location(text: str) -> bool:
     """
     Use Groq to verify if a string is a valid geographic location.
@@ -6,19 +6,30 @@ Returns structured education data for local processing (UNT filtering, sorting,
 """
 
 import re
+from functools import lru_cache
 from settings import logger
 from groq_client import (
-    _get_client, is_groq_available, GROQ_MODEL, BS4_AVAILABLE,
+    _get_client, is_groq_available, GROQ_MODEL, BS4_AVAILABLE, SKILL_TAG_CONTAINER_SELECTOR,
     save_debug_html, parse_groq_json_response,
-    _clean_doubled
+    _clean_doubled, is_skill_summary_text
 )
 
 if BS4_AVAILABLE:
     from bs4 import BeautifulSoup
+    import soupsieve
+
+    _HIDDEN_OR_ICON_SELECTOR = soupsieve.compile("[class*='visually-hidden'], [class*='artdeco-button__icon']")
+    _SHOW_MORE_SELECTOR = soupsieve.compile("[class*='inline-show-more-text']")
+    _ACTIVITIES_SELECTOR = soupsieve.compile("[class*='activities-societies'], [class*='pv-shared-text-with-see-more']")
 
 
 CLOUD_EDU_MAX_LEN = 255
 
+# Keyword presence check used on raw/cleaned education HTML (plain substring
+# semantics); case-insensitive so large inputs are not lowercased first.
+_UNT_KEYWORD_RE = re.compile(r"university of north texas|north texas|unt", re.IGNORECASE)
+_UNT_SCHOOL_RE = re.compile(r"university of north texas|\bunt\b", re.IGNORECASE)
+
 
 def _looks_like_description_blob(text: str) -> bool:
     t = (text or "").strip()
@@ -34,6 +45,23 @@ def _looks_like_description_blob(text: str) -> bool:
     return False
 
 
+def _marker_alternation(markers):
+    """Substring alternation: ``pattern.search(text)`` == ``any(m in text for m in markers)``."""
+    return re.compile("|".join(re.escape(m) for m in markers))
+
+
+_PHD_MARKERS_RE = _marker_alternation(("ph.d", "phd", "doctor", "doctorate"))
+_MASTERS_MARKERS_RE = _marker_alternation((
+    "master", "m.s.", "m.s", "ms,", "ms ", "m.a.", "m.a", "ma,", "ma ",
+    "mba", "m.eng", "meng", "m.tech", "mtech", "m.ed",
+))
+_BACHELORS_MARKERS_RE = _marker_alternation((
+    "bachelor", "b.s.", "b.s", "bs,", "bs ", "b.a.", "b.a", "ba,", "ba ",
+    "b.e.", "b.e", "b.tech", "btech", "b.eng",
+))
+
+
+@lru_cache(maxsize=1024)
 def _degree_level_key(degree_str: str) -> str:
     """
     Reduce a degree string to a canonical level key for dedup comparison.
@@ -44,17 +72,15 @@ def _degree_level_key(degree_str: str) -> str:
     if not d:
         return ""
     # PhD / Doctorate
-    if any(k in d for k in ["ph.d", "phd", "doctor", "doctorate"]):
+    if _PHD_MARKERS_RE.search(d):
         return "phd"
     # Masters
-    if any(k in d for k in ["master", "m.s.", "m.s", "ms,", "ms ", "m.a.", "m.a", "ma,", "ma ",
-                              "mba", "m.eng", "meng", "m.tech", "mtech", "m.ed"]):
+    if _MASTERS_MARKERS_RE.search(d):
         return "masters"
     if d in ("ms", "ma", "msc", "m.sc", "m.sc."):
         return "masters"
     # Bachelors
-    if any(k in d for k in ["bachelor", "b.s.", "b.s", "bs,", "bs ", "b.a.", "b.a", "ba,", "ba ",
-                              "b.e.", "b.e", "b.tech", "btech", "b.eng"]):
+    if _BACHELORS_MARKERS_RE.search(d):
         return "bachelors"
     if d in ("bs", "ba", "bsc", "b.sc", "b.sc.", "be"):
         return "bachelors"
@@ -75,8 +101,7 @@ def _is_unt_school(school_name: str) -> bool:
     """Return True when the school string refers to UNT."""
     if not school_name:
         return False
-    s = school_name.lower()
-    return ("university of north texas" in s) or re.search(r"\bunt\b", s) is not None
+    return _UNT_SCHOOL_RE.search(school_name) is not None
 
 
 def _should_drop_low_confidence_school_only_entry(
@@ -97,6 +122,9 @@ def _should_drop_low_confidence_school_only_entry(
     return bool(school) and not has_details and not _is_unt_school(school)
 
 
+# Small cache: the strict-mode retry in the scraper re-sends the same section
+# HTML, so the cleaned text is reused instead of re-parsing it with BS4.
+@lru_cache(maxsize=4)
 def _education_html_to_structured_text(html: str, profile_name: str = "unknown", relaxed: bool = False) -> str:
     """
     Convert education section HTML into clean structured text for the LLM.
@@ -126,12 +154,10 @@ def _education_html_to_structured_text(html: str, profile_name: str = "unknown",
     #    because LinkedIn wraps school name / degree / dates inside these divs.
     #    Conditional: Only do this if NOT relaxed.
     if not relaxed:
-        for tag in soup.find_all(class_=lambda x: x and any(
-            c in x for c in ['visually-hidden', 'artdeco-button__icon']
-        )):
+        for tag in _HIDDEN_OR_ICON_SELECTOR.select(soup):
             tag.decompose()
             
-    for tag in soup.find_all(class_=lambda x: x and 'inline-show-more-text' in x):
+    for tag in _SHOW_MORE_SELECTOR.select(soup):
         tag.unwrap()  # keeps inner content, removes the wrapping tag
 
     # 3. Remove diamond-icon skill/tag entries from sub-components
@@ -139,7 +165,7 @@ def _education_html_to_structured_text(html: str, profile_name: str = "unknown",
     #    Conditional: Only do this if NOT relaxed.
     if not relaxed:
         for sub_comp in soup.select('.pvs-entity__sub-components'):
-            for container in sub_comp.find_all('div', class_=lambda c: c and 't-14' in c and 't-normal' in c and 't-black' in c and 't-black--light' not in c):
+            for container in SKILL_TAG_CONTAINER_SELECTOR.select(sub_comp):
                 if container.find('strong'):
                     li_parent = container.find_parent('li')
                     if li_parent:
@@ -149,8 +175,7 @@ def _education_html_to_structured_text(html: str, profile_name: str = "unknown",
 
     # 4. Remove skill lines like "Civil Engineering, Problem Solving and +4 skills"
     for tag in soup.find_all(["strong", "span"]):
-        txt = tag.get_text()
-        if ("skill" in txt.lower() and "+" in txt) or ("skills" in txt.lower() and ("+" in txt or "," in txt)):
+        if is_skill_summary_text(tag.get_text()):
             parent = tag.find_parent("div", class_="display-flex")
             if parent:
                 parent.decompose()
@@ -158,9 +183,7 @@ def _education_html_to_structured_text(html: str, profile_name: str = "unknown",
                 tag.decompose()
 
     # 5. Remove activity-related sections (they show in education area sometimes)
-    for tag in soup.find_all(class_=lambda x: x and any(
-        c in x for c in ['activities-societies', 'pv-shared-text-with-see-more']
-    )):
+    for tag in _ACTIVITIES_SELECTOR.select(soup):
         tag.decompose()
 
     # 5b. Text-based fallback: remove any element whose text starts with
@@ -259,9 +282,7 @@ def extract_education_with_groq(education_html: str, profile_name: str = "unknow
     # 2. Check if we lost the target university (UNT) keywords found in raw JSON.
     # 3. If lost, retry with relaxed cleaning.
     
-    unt_keywords = ["university of north texas", "north texas", "unt"]
-    raw_lower = education_html.lower()
-    has_unt_raw = any(k in raw_lower for k in unt_keywords)
+    has_unt_raw = _UNT_KEYWORD_RE.search(education_html) is not None
     
     # Try Standard
     structured_text = _education_html_to_structured_text(education_html, profile_name, relaxed=False)
@@ -272,8 +293,7 @@ def extract_education_with_groq(education_html: str, profile_name: str = "unknow
 
     # 1. Check for lost UNT keywords
     if has_unt_raw:
-        text_lower = structured_text.lower()
-        if not any(k in text_lower for k in unt_keywords):
+        if not _UNT_KEYWORD_RE.search(structured_text):
             should_retry = True
             retry_reason = "Loss of UNT keywords"
 
@@ -290,7 +310,7 @@ def extract_education_with_groq(education_html: str, profile_name: str = "unknow
         
         # Log result of retry
         if has_unt_raw:
-            if any(k in structured_text.lower() for k in unt_keywords):
+            if _UNT_KEYWORD_RE.search(structured_text):
                      logger.debug("Relaxed cleaning recovered UNT keywords.")
             else:
                     logger.warning("      ❌ Relaxed cleaning still missed UNT keywords (check debug HTML).")
@@ -9,8 +9,8 @@ from pathlib import Path
 from settings import logger
 from groq_client import (
     _get_client, is_groq_available, GROQ_MODEL, BS4_AVAILABLE,
-    SCRAPER_DEBUG_HTML, save_debug_html, parse_groq_json_response,
-    _clean_doubled, parse_groq_date
+    NOISE_CLASS_SELECTOR, SKILL_TAG_CONTAINER_SELECTOR, SCRAPER_DEBUG_HTML, save_debug_html, parse_groq_json_response,
+    _clean_doubled, parse_groq_date, is_skill_summary_text
 )
 
 if BS4_AVAILABLE:
@@ -264,12 +264,12 @@ def _html_to_structured_text(html: str, profile_name: str = "unknown") -> str:
     # Remove noise elements
     for tag in soup.find_all(['script', 'style', 'svg', 'img', 'iframe', 'noscript']):
         tag.decompose()
-    for tag in soup.find_all(class_=lambda x: x and any(c in x for c in ['visually-hidden', 'inline-show-more-text', 'artdeco-button__icon'])):
+    for tag in NOISE_CLASS_SELECTOR.select(soup):
         tag.decompose()
     
     # Remove diamond-icon skill/tag entries from sub-components
     for sub_comp in soup.select('.pvs-entity__sub-components'):
-        for container in sub_comp.find_all('div', class_=lambda c: c and 't-14' in c and 't-normal' in c and 't-black' in c and 't-black--light' not in c):
+        for container in SKILL_TAG_CONTAINER_SELECTOR.select(sub_comp):
             if container.find('strong'):
                 li_parent = container.find_parent('li')
                 if li_parent:
@@ -279,8 +279,7 @@ def _html_to_structured_text(html: str, profile_name: str = "unknown") -> str:
     
     # Remove skill lines like "Teaching, Computer Science and +1 skill"
     for tag in soup.find_all(["strong", "span"]):
-        txt = tag.get_text()
-        if ("skill" in txt.lower() and "+" in txt) or ("skills" in txt.lower() and ("+" in txt or "," in txt)):
+        if is_skill_summary_text(tag.get_text()):
             parent = tag.find_parent("div", class_="display-flex")
             if parent:
                 parent.decompose()
@@ -352,21 +351,19 @@ def clean_html_for_llm(html: str, profile_name: str = "unknown") -> str:
             if useful_classes:
                 tag['class'] = useful_classes
     
-    for tag in soup.find_all(class_=lambda x: x and any(c in x for c in ['visually-hidden', 'inline-show-more-text', 'artdeco-button__icon'])):
+    for tag in NOISE_CLASS_SELECTOR.select(soup):
         tag.decompose()
 
     for tag in soup.find_all(["strong", "span"]):
-        txt = tag.get_text()
-        if ("skill" in txt.lower() and "+" in txt) or "skills" in txt.lower():
-             if "+" in txt or "," in txt:
-                parent = tag.find_parent("div", class_="display-flex")
-                if parent:
-                    parent.decompose()
-                else:
-                    tag.decompose()
+        if is_skill_summary_text(tag.get_text()):
+            parent = tag.find_parent("div", class_="display-flex")
+            if parent:
+                parent.decompose()
+            else:
+                tag.decompose()
 
     for sub_comp in soup.select('.pvs-entity__sub-components'):
-        for container in sub_comp.find_all('div', class_=lambda c: c and 't-14' in c and 't-normal' in c and 't-black' in c and 't-black--light' not in c):
+        for container in SKILL_TAG_CONTAINER_SELECTOR.select(sub_comp):
             if container.find('strong'):
                 li_parent = container.find_parent('li')
                 if li_parent:
@@ -376,7 +373,8 @@ def clean_html_for_llm(html: str, profile_name: str = "unknown") -> str:
 
     for _ in range(3):
         for tag in soup.find_all():
-            if len(tag.get_text(strip=True)) == 0 and not tag.find_all():
+            # find(True) stops at the first child tag instead of listing them all.
+            if tag.find(True) is None and not tag.get_text(strip=True):
                 tag.decompose()
     
     cleaned = str(soup)
@@ -15,6 +15,7 @@ import subprocess
 import urllib.parse
 import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -403,6 +404,9 @@ def _request_manual_intervention(reason, profile_url=None):
 # ============================================================
 exit_requested = False
 force_exit = False
+# Set together with force_exit so the inter-profile delay can block in a single
+# wait and still wake immediately on "force exit".
+_force_exit_event = threading.Event()
 _exit_listener_active = False
 manual_intervention_requested = False
 session_profiles_scraped = 0
@@ -428,6 +432,11 @@ _flagged_urls_this_run = set()
 _current_scrape_run_id = None
 _current_scrape_run_uuid = None
 _cloud_verify_semaphore = threading.Semaphore(4)
+# Scraper whose last profile load time is credited against the pacing delay.
+_pacing_scraper = None
+# One background saver lets a profile's CSV/DB/geocode work overlap the
+# inter-profile delay; a single worker keeps saves ordered.
+_profile_save_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="profile-save")
 _ESTIMATED_NON_DELAY_SECONDS_PER_PROFILE = 25
 
 _CLOUD_VARCHAR_LIMITS = {
@@ -583,6 +592,7 @@ def _exit_listener():
             cmd = input().strip().lower()
             if cmd == "force exit":
                 force_exit = True
+                _force_exit_event.set()
                 logger.warning("🔴 FORCE EXIT requested")
                 break
             elif cmd == "exit":
@@ -633,6 +643,8 @@ UNT_DISCIPLINE_SEARCH_BASE_URL = (
     "https://www.linkedin.com/search/results/people/?schoolFilter=%5B%226464%22%5D"
 )
 _TEMP_SEARCH_QUERY_KEYS = {"sid", "origin", "position", "trackingId", "searchId"}
+_PEOPLE_SEARCH_URL = "https://www.linkedin.com/search/results/people/"
+_NAMES_SEARCH_STATIC_PARAMS = {"schoolFilter": '["6464"]'}
 
 DISCIPLINE_ALIAS_LABELS = {
     "software": "Software, Data, AI & Cybersecurity",
@@ -903,13 +915,16 @@ def wait_between_profiles():
             logger.info(f"🛑 Reached GUI Max Runtime limit ({GUI_MAX_RUNTIME_MINUTES} mins). Exiting gracefully.")
             sys.exit(0)
 
+    # The human-pacing delay runs from when the last profile started loading,
+    # so its page-load time is taken off the wait rather than added to it.
     delay = random.uniform(config.MIN_DELAY, config.MAX_DELAY)
+    load_seconds = getattr(_pacing_scraper, "last_profile_load_seconds", 0.0) or 0.0
+    delay = max(0.0, delay - load_seconds)
     logger.info(f"Next profile in {delay:.0f}s")
 
-    for _ in range(10):
-        if force_exit:
-            return
-        time.sleep(delay / 10)
+    if force_exit:
+        return
+    _force_exit_event.wait(delay)
 
 
 def _format_duration_short(total_seconds):
@@ -1114,8 +1129,8 @@ def _save_and_track(data, input_url, history_mgr):
     LinkedIn often uses multiple URLs for the same profile (vanity vs ID-based).
     If redirected input_url → canonical_url:
       - We mark both URLs in history so neither is re-visited.
-      - The CSV utility uses drop_duplicates to replace older entries 
-        sharing the same canonical URL with the latest data.
+      - save_profile_to_csv checks the canonical URL against its in-memory URL
+        set: new URLs are appended, known ones replace their older row.
     """
     if not data or data == "PAGE_NOT_FOUND" or _is_non_target_scrape_result(data):
         return False
@@ -1171,6 +1186,30 @@ def _save_and_track(data, input_url, history_mgr):
             record_scrape_run_flag(_current_scrape_run_id, canonical_url, review_reason)
             _flagged_urls_this_run.add(canonical_url)
 
+    # Check if canonical URL was already saved in this session under a different input URL.
+    # Done before geocoding so a known redirect does not pay for a lookup it will discard.
+    if original_url and history_mgr.should_skip(canonical_url):
+        logger.info(f"  ↩️  Profile Already Visited, Skipping: {canonical_url}")
+        # Only canonicalize (which deletes the old URL row) when the canonical URL
+        # was actually persisted before. If `should_skip` is True purely because we
+        # visited the canonical URL but did NOT save it (e.g. flagged/non-UNT),
+        # deleting the old URL row would erase the only stored copy of this person.
+        canonical_key = _normalize_profile_url(canonical_url)
+        canonical_entry = getattr(history_mgr, "visited_history", {}) or {}
+        canonical_saved = (
+            (canonical_entry.get(canonical_key) or {}).get("saved", "no").lower() == "yes"
+        )
+        if canonical_saved:
+            _canonicalize_redirect_url(original_url, canonical_url, history_mgr)
+        else:
+            logger.info(
+                "  ↩️  Skipping redirect canonicalization for %s -> %s "
+                "(canonical URL was visited but not saved; preserving old URL row)",
+                original_url,
+                canonical_url,
+            )
+        return False
+    
     # Geocode once on raw location; if unknown, optionally normalize location text
     # via Groq and retry exactly once.
     if data.get("location") and (data.get("latitude") is None or data.get("longitude") is None):
@@ -1217,29 +1256,6 @@ def _save_and_track(data, input_url, history_mgr):
             _geocode_network_failures_this_run += 1
             logger.debug(f"Auto-geocoding skipped for {canonical_url}: {geocode_err}")
 
-    # Check if canonical URL was already saved in this session under a different input URL
-    if original_url and history_mgr.should_skip(canonical_url):
-        logger.info(f"  ↩️  Profile Already Visited, Skipping: {canonical_url}")
-        # Only canonicalize (which deletes the old URL row) when the canonical URL
-        # was actually persisted before. If `should_skip` is True purely because we
-        # visited the canonical URL but did NOT save it (e.g. flagged/non-UNT),
-        # deleting the old URL row would erase the only stored copy of this person.
-        canonical_key = _normalize_profile_url(canonical_url)
-        canonical_entry = getattr(history_mgr, "visited_history", {}) or {}
-        canonical_saved = (
-            (canonical_entry.get(canonical_key) or {}).get("saved", "no").lower() == "yes"
-        )
-        if canonical_saved:
-            _canonicalize_redirect_url(original_url, canonical_url, history_mgr)
-        else:
-            logger.info(
-                "  ↩️  Skipping redirect canonicalization for %s -> %s "
-                "(canonical URL was visited but not saved; preserving old URL row)",
-                original_url,
-                canonical_url,
-            )
-        return False
-    
     if database_handler.save_profile_to_csv(data):
         # Persistence order:
         # 1) CSV write (durable backup / local artifact),
@@ -1360,89 +1376,116 @@ def _log_post_save_result(data, saved, verb="Processed"):
         logger.debug(f"Not saved ({block_code}): {profile_name}")
 
 
+def _save_track_and_log(data, input_url, history_mgr, verb="Saved"):
+    saved = _save_and_track(data, input_url, history_mgr)
+    _log_post_save_result(data, saved, verb=verb)
+    return saved
+
+
+def _finish_pending_save(future):
+    """Wait for a background profile save and log (not raise) its failure."""
+    if future is None:
+        return None
+    try:
+        return future.result()
+    except Exception as e:
+        logger.error(f"❌ Error saving profile: {e}")
+        return False
+
+
 def run_names_mode(scraper, nav, history_mgr):
     input_csv = os.getenv("INPUT_CSV", "engineering_graduates.csv")
     csv_path = PROJECT_ROOT / input_csv
 
     logger.info(f"--- MODE: Names ({csv_path}) ---")
     names = utils.load_names_from_csv(csv_path)
-    school_id = "6464"
 
-    for name in names:
-        if should_stop():
-            return
+    pending_save = None
+    try:
+        for name in names:
+            if should_stop():
+                return
 
-        q = urllib.parse.quote_plus(f'"{name}"')
-        search_url = (
-            f"https://www.linkedin.com/search/results/people/?"
-            f"keywords={q}&schoolFilter=%5B%22{school_id}%22%5D"
-        )
+            query = urllib.parse.urlencode({"keywords": f'"{name}"', **_NAMES_SEARCH_STATIC_PARAMS})
+            search_url = f"{_PEOPLE_SEARCH_URL}?{query}"
 
-        ok = nav.get(search_url)
-        if not ok:
-            logger.warning("⚠️ Search page unhealthy. Skipping this name.")
-            continue
+            ok = nav.get(search_url)
+            if not ok:
+                logger.warning("⚠️ Search page unhealthy. Skipping this name.")
+                continue
 
-        time.sleep(5)
-        scraper.scroll_full_page()
+            time.sleep(5)
+            scraper.scroll_full_page()
 
-        urls = scraper.extract_profile_urls_from_page()
-        for url in urls:
-            url = _normalize_profile_url(url)
-            if not url:
-                continue
-            if check_force_exit():
-                return
+            urls = scraper.extract_profile_urls_from_page()
+            for url in urls:
+                url = _normalize_profile_url(url)
+                if not url:
+                    continue
+                if check_force_exit():
+                    return
 
-            if config.is_blocked_url(url):
-                continue
+                if config.is_blocked_url(url):
+                    continue
 
-            if history_mgr.should_skip(url):
-                logger.info(f"  ↩️  Profile Already Visited, Skipping: {url}")
-                continue
+                # Settle the previous save first so visited history is current.
+                _finish_pending_save(pending_save)
+                pending_save = None
+                if history_mgr.should_skip(url):
+                    logger.info(f"  ↩️  Profile Already Visited, Skipping: {url}")
+                    continue
 
-            # NOTE: scrape_profile_page likely handles its own navigation.
-            try:
-                data = scraper.scrape_profile_page(url)
-            except Exception as e:
-                if _should_recover_from_session_error(str(e)):
-                    success, data = _recover_browser_session(scraper, url, nav)
-                    if not success:
-                        logger.error(f"❌ Error processing {url}: recovery failed")
+                # NOTE: scrape_profile_page likely handles its own navigation.
+                try:
+                    data = scraper.scrape_profile_page(url)
+                except Exception as e:
+                    if _should_recover_from_session_error(str(e)):
+                        success, data = _recover_browser_session(scraper, url, nav)
+                        if not success:
+                            logger.error(f"❌ Error processing {url}: recovery failed")
+                            continue
+                    else:
+                        logger.error(f"❌ Error processing {url}: {e}")
                         continue
-                else:
-                    logger.error(f"❌ Error processing {url}: {e}")
+
+                if data == "MANUAL_INTERVENTION_REQUIRED":
+                    _request_manual_intervention("checkpoint_or_signin_overlay", url)
+                    return
+
+                if data == "PAGE_NOT_FOUND":
+                    logger.warning(f"  💀 Dead URL skipped: {url}")
                     continue
 
-            if data == "MANUAL_INTERVENTION_REQUIRED":
-                _request_manual_intervention("checkpoint_or_signin_overlay", url)
-                return
+                if _is_non_target_scrape_result(data):
+                    _track_non_target_profile_visit(data, url, history_mgr)
+                    if should_stop():
+                        return
+                    wait_between_profiles()
+                    continue
 
-            if data == "PAGE_NOT_FOUND":
-                logger.warning(f"  💀 Dead URL skipped: {url}")
-                continue
+                if data and data != "PAGE_NOT_FOUND":
+                    pending_save = _profile_save_pool.submit(_save_track_and_log, data, url, history_mgr)
 
-            if _is_non_target_scrape_result(data):
-                _track_non_target_profile_visit(data, url, history_mgr)
                 if should_stop():
                     return
-                wait_between_profiles()
-                continue
-
-            if data and data != "PAGE_NOT_FOUND":
-                saved = _save_and_track(data, url, history_mgr)
-                _log_post_save_result(data, saved, verb="Saved")
-
-            if should_stop():
-                return
 
-            wait_between_profiles()
+                wait_between_profiles()
+    finally:
+        _finish_pending_save(pending_save)
 
 
 def _run_search_results_mode(scraper, nav, history_mgr, base_url, state_mode_key, mode_label, max_profiles_for_mode=0):
     page = 1
     mode_start_count = session_profiles_scraped
 
+    # Profile persistence runs on the background save worker; every exit path
+    # settles it first so the returned count includes the last save.
+    pending_save = None
+
+    def _finish(status):
+        _finish_pending_save(pending_save)
+        return status, (session_profiles_scraped - mode_start_count)
+
     def _mode_quota_reached():
         if max_profiles_for_mode <= 0:
             return False
@@ -1484,13 +1527,15 @@ def _run_search_results_mode(scraper, nav, history_mgr, base_url, state_mode_key
         logger.info(f"↪ Starting {mode_label} from page 1")
 
     while True:
+        _finish_pending_save(pending_save)
+        pending_save = None
         # Stop/threshold checks are repeated at loop boundaries and per profile
         # so long pages can terminate quickly without processing stale work.
         if should_stop():
-            return "stopped", (session_profiles_scraped - mode_start_count)
+            return _finish("stopped")
         if _mode_quota_reached():
             logger.info(f"Reached quota for {mode_label}: {max_profiles_for_mode} new profiles.")
-            return "threshold_reached", (session_profiles_scraped - mode_start_count)
+            return _finish("threshold_reached")
 
         url = base_url if page == 1 else f"{base_url}&page={page}"
         _save_state(base_url, page)
@@ -1499,7 +1544,7 @@ def _run_search_results_mode(scraper, nav, history_mgr, base_url, state_mode_key
         ok = nav.get(url)
         if not ok:
             logger.warning("Search page unhealthy. Stopping search loop.")
-            return "network_error", (session_profiles_scraped - mode_start_count)
+            return _finish("network_error")
 
         time.sleep(5)
         scraper.scroll_full_page()
@@ -1508,19 +1553,22 @@ def _run_search_results_mode(scraper, nav, history_mgr, base_url, state_mode_key
         if not urls:
             # Check for no results vs exhaustion
             _save_state(base_url, 1) # reset pagination since we reached end
-            return "no_results" if page == 1 else "exhausted", (session_profiles_scraped - mode_start_count)
+            return _finish("no_results" if page == 1 else "exhausted")
 
         for profile_url in urls:
+            # Settle the previous save so the quota and visited checks are current.
+            _finish_pending_save(pending_save)
+            pending_save = None
             if _mode_quota_reached():
                 logger.info(f"Reached quota for {mode_label}: {max_profiles_for_mode} new profiles.")
-                return "threshold_reached", (session_profiles_scraped - mode_start_count)
+                return _finish("threshold_reached")
             
             profile_url = _normalize_profile_url(profile_url)
             if not profile_url:
                 continue
 
             if check_force_exit():
-                return "stopped", (session_profiles_scraped - mode_start_count)
+                return _finish("stopped")
 
             if config.is_blocked_url(profile_url):
                 continue
@@ -1543,7 +1591,7 @@ def _run_search_results_mode(scraper, nav, history_mgr, base_url, state_mode_key
 
             if data == "MANUAL_INTERVENTION_REQUIRED":
                 _request_manual_intervention("checkpoint_or_signin_overlay", profile_url)
-                return "manual_intervention", (session_profiles_scraped - mode_start_count)
+                return _finish("manual_intervention")
 
             if data == "PAGE_NOT_FOUND":
                 logger.warning(f"  💀 Dead URL skipped: {profile_url}")
@@ -1552,16 +1600,15 @@ def _run_search_results_mode(scraper, nav, history_mgr, base_url, state_mode_key
             if _is_non_target_scrape_result(data):
                 _track_non_target_profile_visit(data, profile_url, history_mgr)
                 if should_stop():
-                    return "stopped", (session_profiles_scraped - mode_start_count)
+                    return _finish("stopped")
                 wait_between_profiles()
                 continue
 
             if data and data != "PAGE_NOT_FOUND":
-                saved = _save_and_track(data, profile_url, history_mgr)
-                _log_post_save_result(data, saved, verb="Saved")
+                pending_save = _profile_save_pool.submit(_save_track_and_log, data, profile_url, history_mgr)
 
             if should_stop():
-                return "stopped", (session_profiles_scraped - mode_start_count)
+                return _finish("stopped")
 
             wait_between_profiles()
 
@@ -1906,29 +1953,35 @@ def run_update_mode(scraper, nav, history_mgr):
     Re-scrape existing alumni that are due for refresh, ordered by oldest
     last_updated first.
     """
-    profiles, cutoff_date = database_handler.get_outdated_profiles_from_db()
-    if cutoff_date:
-        logger.info(f"📅 Update cutoff: last_updated older than {cutoff_date.strftime('%Y-%m-%d %H:%M:%S')}")
-
-    if not profiles:
-        logger.info("📋 Update mode: no existing profiles currently require refresh.")
-        return
+    cutoff_date = database_handler.get_outdated_cutoff_date()
+    logger.info(f"📅 Update cutoff: last_updated older than {cutoff_date.strftime('%Y-%m-%d %H:%M:%S')}")
 
+    # Build the queue straight off the streaming cursor; only the
+    # (url, last_updated) pairs we actually keep are held in memory.
     queue = []
     seen = set()
-    for row in profiles:
-        if isinstance(row, dict):
-            raw_url = row.get("linkedin_url")
-            last_updated = row.get("last_updated")
-        else:
-            raw_url = row[0] if len(row) > 0 else ""
-            last_updated = row[3] if len(row) > 3 else None
+    fetched = 0
+    try:
+        for row in database_handler.iter_outdated_profiles_from_db(cutoff_date):
+            fetched += 1
+            if isinstance(row, dict):
+                raw_url = row.get("linkedin_url")
+                last_updated = row.get("last_updated")
+            else:
+                raw_url = row[0] if len(row) > 0 else ""
+                last_updated = row[3] if len(row) > 3 else None
 
-        profile_url = _normalize_profile_url(raw_url)
-        if not profile_url or profile_url in seen or config.is_blocked_url(profile_url):
-            continue
-        seen.add(profile_url)
-        queue.append((profile_url, last_updated))
+            profile_url = _normalize_profile_url(raw_url)
+            if not profile_url or profile_url in seen or config.is_blocked_url(profile_url):
+                continue
+            seen.add(profile_url)
+            queue.append((profile_url, last_updated))
+    except Exception as e:
+        logger.error(f"Error fetching outdated profiles: {e}")
+
+    if not fetched:
+        logger.info("📋 Update mode: no existing profiles currently require refresh.")
+        return
 
     if not queue:
         logger.info("📋 Update mode: no valid URLs available after filtering blocked/invalid entries.")
@@ -2042,6 +2095,10 @@ def _remove_dead_urls(dead_urls, flagged_file, history_mgr):
     
     # 3. Remove from visited_history.csv
     try:
+        # Release buffered history appends so they cannot land after the rewrite.
+        close_history = getattr(history_mgr, "close", None)
+        if callable(close_history):
+            close_history()
         visited_csv = PROJECT_ROOT / "scraper" / "output" / "visited_history.csv"
         if visited_csv.exists():
             rows = []
@@ -2094,6 +2151,12 @@ def _remove_dead_urls(dead_urls, flagged_file, history_mgr):
 # ============================================================
 # MAIN
 # ============================================================
+def _load_visited_history():
+    history_mgr = database_handler.HistoryManager()
+    history_mgr.sync_with_db()
+    return history_mgr
+
+
 def main():
     global _cloud_upsert_consecutive_failures, _cloud_upsert_disabled_for_run
     global _geocode_failures_this_run, _geocode_failure_locations
@@ -2103,6 +2166,7 @@ def main():
     global _sqlite_writes_this_run
     global _flagged_urls_this_run
     global _current_scrape_run_id, _current_scrape_run_uuid, session_profiles_scraped
+    global _pacing_scraper
     _cloud_upsert_consecutive_failures = 0
     _cloud_upsert_disabled_for_run = False
     _geocode_failures_this_run = 0
@@ -2140,8 +2204,12 @@ def main():
     except Exception as create_run_err:
         logger.warning(f"Could not create scrape run metadata: {create_run_err}")
 
-    history_mgr = database_handler.HistoryManager()
-    history_mgr.sync_with_db()
+    # History sync (DB fetch + CSV rewrite) and the output CSV check don't
+    # depend on the browser, so they run while Chrome starts up below.
+    startup_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="startup")
+    history_future = startup_pool.submit(_load_visited_history)
+    output_csv_future = startup_pool.submit(database_handler.ensure_alumni_output_csv)
+    startup_pool.shutdown(wait=False)
 
     disable_db = os.getenv("DISABLE_DB", "0") == "1"
     logger.info(
@@ -2170,13 +2238,17 @@ def main():
     except Exception:
         pass
 
-    database_handler.ensure_alumni_output_csv()
+    # Collect the background startup work before Chrome or the sleep inhibitor
+    # exist, so a failed history load/DB sync cannot leak either of them.
+    history_mgr = history_future.result()
+    output_csv_future.result()
 
     # Enable sleep prevention before starting scraper
     _prevent_system_sleep()
 
     scraper = LinkedInScraper()
     scraper.setup_driver()
+    _pacing_scraper = scraper
     run_status = "completed"
 
     try:
@@ -2223,6 +2295,8 @@ def main():
         run_status = "failed"
         logger.exception(f"Unhandled scraping error: {unhandled_err}")
     finally:
+        # Let any queued background profile save land before counts are reported.
+        _finish_pending_save(_profile_save_pool.submit(lambda: None))
         if manual_intervention_requested and run_status == "completed":
             run_status = "interrupted"
         run_duration_seconds = int((datetime.now() - SCRIPT_START_TIME).total_seconds())
@@ -2285,6 +2359,11 @@ def main():
         if _geocode_failure_locations:
             logger.info("SUMMARY|unknown_locations=%s", "; ".join(sorted(_geocode_failure_locations)[:10]))
 
+        close_history = getattr(history_mgr, "close", None)
+        if callable(close_history):
+            close_history()
+        database_handler.compact_alumni_output_csv()
+
         try:
             scraper_dir = str(Path(__file__).resolve().parent)
             if scraper_dir not in sys.path:
@@ -1,11 +1,16 @@
 import time
+import copy
 import json
 import random
 import re
 import urllib.parse
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Comment, SoupStrainer
+import soupsieve
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -16,11 +21,26 @@ from selenium.common.exceptions import NoSuchWindowException
 # Local imports
 import html
 
+try:
+    import lxml  # noqa: F401 - C-backed tree builder for BeautifulSoup
+    from lxml import etree as _lxml_etree, html as _lxml_html
+    _HTML_PARSER = "lxml"
+    # Search-result profile links, pulled straight off the lxml tree in C.
+    _PROFILE_HREFS_XPATH = _lxml_etree.XPath("//a[contains(@href, '/in/')]/@href")
+except ImportError:
+    _lxml_html = None
+    _HTML_PARSER = "html.parser"
+
+try:
+    import orjson as _orjson  # optional faster JSON decoder for the cookie jar
+except ImportError:
+    _orjson = None
+
 # Local imports
 import scraper_utils as utils
 import settings as config
 from settings import logger, print_profile_summary
-from entity_classifier import classify_entity, is_location, is_university, get_classifier
+from entity_classifier import classify_entity, is_location, is_university
 from groq_client import (
     is_groq_available,
     verify_location,
@@ -96,6 +116,202 @@ _EMP_LINE_TAIL = re.compile(
 )
 
 
+_CONTACT_INFO_RE = re.compile(r"contact info", re.IGNORECASE)
+_CONTACT_INFO_SUFFIX_RE = re.compile(r"\s*[·|]\s*Contact info\s*$", re.IGNORECASE)
+_TRAILING_PARENTHETICAL_RE = re.compile(r"\s*\(.*?\)\s*$")
+_HEADLINE_DATE_PREFIX_RE = re.compile(r'^\d{4}|^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)')
+
+
+def _literal_alternation(words):
+    """Compile a plain substring alternation; callers search already-lowercased text."""
+    return re.compile("|".join(re.escape(w) for w in sorted(words, key=len, reverse=True)))
+
+
+# Top-card location heuristics: one regex scan per candidate instead of a
+# Python-level `any(x in text ...)` loop per keyword list.
+_REGION_LOCATION_RE = _literal_alternation((
+    "metropolitan area", "metro area", "metroplex", "bay area", " metro",
+    "greater ", " region", " county", "silicon valley", "tri-state",
+    "inland empire", "puget sound", "research triangle", "twin cities",
+    "chicagoland", "hampton roads", "south florida",
+))
+# Badge-like entries (schools, companies) and connection/follower/contact or
+# employment-type text share one rejection scan.
+_LOCATION_REJECT_RE = _literal_alternation((
+    "university", "college", "school", "institute",
+    "inc", "corp", "llc", "company", "technologies", "solutions",
+    "enterprises", "consulting", "software", "systems", "group",
+    "connection", "follower", "contact info", "full-time", "part-time", "contract", "internship",
+))
+_CONTACT_NEIGHBOR_NOISE_RE = _literal_alternation((
+    "connection", "follower", "company", "full-time", "part-time", "contract", "internship",
+))
+_EDU_INSTITUTION_RE = _literal_alternation(("university", "college", "school", "institute"))
+_COUNTRY_HINT_RE = _literal_alternation((
+    "united states", "india", "canada", "uk", "united kingdom",
+    "germany", "australia", "france", "japan", "china", "brazil", "mexico",
+    "saudi arabia", "uae", "united arab emirates", "qatar", "kuwait",
+    "bahrain", "oman", "jordan", "egypt", "turkey", "pakistan",
+    "bangladesh", "sri lanka", "nepal", "malaysia", "singapore",
+    "indonesia", "philippines", "vietnam", "thailand", "south korea",
+    "nigeria", "kenya", "ghana", "south africa", "ethiopia",
+    "italy", "spain", "netherlands", "belgium", "switzerland",
+    "sweden", "norway", "denmark", "finland", "poland",
+    "ireland", "new zealand", "portugal", "greece",
+))
+_FALLBACK_GEO_RE = _literal_alternation((
+    "united states", "india", "canada", "remote",
+    "united kingdom", "germany", "australia", "france",
+    "saudi arabia", "uae", "japan", "china", "brazil", "mexico",
+))
+# Every N freshly scraped profiles, park the tab on about:blank and force a GC
+# so renderer memory doesn't keep growing over long runs.
+_BROWSER_MEMORY_RELEASE_EVERY = 50
+_FOUR_DIGIT_YEAR_RE = re.compile(r"\d{4}")
+_SCHOOL_HINT_RE = re.compile(r"(university|college|institute|school)", re.I)
+_DEGREE_HINT_RE = re.compile(r"(degree|bachelor|master|phd|mba|\bbs\b|\bba\b)", re.I)
+_PROFILE_SLUG_RE = re.compile(r"/in/([^/?#]+)")
+# Search-result pages only need their profile anchors; parse nothing else.
+_PROFILE_ANCHOR_STRAINER = SoupStrainer("a", href=_PROFILE_SLUG_RE)
+_ACTIVITIES_PREFIX_RE = re.compile(r'^\s*Activities and societies:', re.IGNORECASE)
+# Text-based experience fallback: lines that are never a company/title, and
+# company / job-title indicator words.
+_FALLBACK_JUNK_LINE_RE = re.compile(
+    r'^(Full-time|Part-time|Contract|Internship|Freelance|Self-employed|Seasonal|Temporary|Remote|Hybrid|On-site)$|'
+    r'^\d+\s*(yr|yrs|year|years|mo|mos|month|months)\b|'
+    r'^·\s*\d+\s*(yr|yrs|mo|mos)|'
+    r'^\d+\s*(yr|yrs)?\s*\d*\s*(mo|mos)?$',
+    re.I,
+)
+_FALLBACK_COMPANY_HINT_RE = re.compile(
+    r'\b(Inc\.?|Corp\.?|LLC|Ltd\.?|Company|Co\.?|Technologies|Solutions|Enterprises|Group|Partners|Services|Consulting|Software|Systems|S\.?R\.?L\.?)(?=\W|$)',
+    re.I,
+)
+_FALLBACK_TITLE_HINT_RE = re.compile(
+    r'\b(Engineer|Developer|Manager|Director|Analyst|Designer|Consultant|Specialist|Associate|Intern|Lead|Senior|Junior|Sr\.?|Jr\.?|Chief|Head|VP|Vice President|Coordinator|Administrator|Representative|Officer|Architect|Scientist|Drafter|Assistant|Fellow|Co-op|Researcher|Student Researcher|Research Assistant|Teaching Assistant)\\b',
+    re.I,
+)
+_DURATION_PREFIX_RE = re.compile(r'^\d+\s*(yr|yrs|mo|mos)', re.I)
+# Context-line / company cleanup: employment-type prefix and trailing
+# "· Full-time ..." suffixes, and the delimiters a context line is split on.
+_CONTEXT_EMPLOYMENT_PREFIX_RE = re.compile(r'^(Full-time|Part-time|Contract|Internship)', re.I)
+_CONTEXT_EMPLOYMENT_SUFFIX_RE = re.compile(r'\s*(?:·|•|·|•)\s*(Full-time|Part-time|Contract|Internship|Remote|Hybrid).*$', re.I)
+_CONTEXT_DELIMITER_RE = re.compile(r'\s+(?:at|@)\s+|\s*\|\s*|\s*(?:-|\u2013|\u2014|–|—)\s*|\s*(?:·|•|·|•)\s*', re.I)
+_COMPANY_EMPLOYMENT_SUFFIX_RE = re.compile(
+    r"\s*·\s*(Full-time|Part-time|Contract|Internship|Remote|Hybrid|On-site|Self-employed|Freelance|Seasonal|Temporary|Apprenticeship).*$",
+    re.I,
+)
+
+
+def _collect_top_card_nodes(root):
+    """Bucket the top-card candidate tags under ``root`` in a single tree walk.
+
+    Replaces the separate h1/h2/headline/location/contact-info ``find_all``
+    scans; each bucket keeps document order so callers see the same sequence.
+    """
+    buckets = {
+        "h1": [],
+        "h2": [],
+        "headline": [],
+        "suggestion": [],
+        "small_text": [],
+        "contact_info": [],
+    }
+    for tag in root.find_all(True):
+        name = tag.name
+        if name in ("h1", "h2"):
+            buckets[name].append(tag)
+            continue
+        if name not in ("div", "span", "a"):
+            continue
+        if name != "a":
+            class_text = " ".join(tag.get("class") or [])
+            if name == "div":
+                if "text-body-medium" in class_text:
+                    buckets["headline"].append(tag)
+                if tag.has_attr("data-generated-suggestion-target"):
+                    buckets["suggestion"].append(tag)
+            if "text-body-small" in class_text:
+                buckets["small_text"].append(tag)
+        string = tag.string
+        if string is not None and _CONTACT_INFO_RE.search(string):
+            buckets["contact_info"].append(tag)
+    return buckets
+
+
+def _leaf_text(tag) -> str:
+    """``tag.get_text(strip=True)`` without the descendant walk when the tag holds a single string."""
+    string = tag.string
+    if string is not None and not isinstance(string, Comment):
+        return string.strip()
+    return tag.get_text(strip=True)
+
+
+_WORK_ARRANGEMENT_TOKENS = frozenset({"remote", "hybrid", "on-site", "onsite"})
+# Context lines that are nothing but a separator bullet.
+_BULLET_ONLY_LINES = frozenset({"\u00b7", "\u2022"})
+# Whole-word employer markers; a long blob containing none of them is narrative text.
+_COMPANY_SIGNAL_TOKENS = frozenset({
+    "inc", "llc", "ltd", "corp", "company", "co", "technologies", "technology",
+    "systems", "solutions", "group", "partners", "health", "hospital",
+    "university", "college", "school", "institute", "laboratory", "lab",
+    "bureau", "foundation", "association",
+})
+# Education item selectors in priority order. Within a run LinkedIn serves
+# nearly every profile with the same layout, so the selector that matched most
+# often so far is tried first; the bare <div> scan always stays the last resort.
+_EDU_ITEM_SELECTORS = (
+    "li.artdeco-list__item",
+    "li.pvs-list__paged-list-item",
+    "div[data-view-name='profile-component-entity']",
+)
+_edu_item_selector_hits = Counter()
+# Readiness condition for the /details/education page: any entry card rendered.
+_EDU_DETAIL_READY_CSS = ", ".join(_EDU_ITEM_SELECTORS)
+
+
+def _ordered_edu_item_selectors():
+    # sorted() is stable, so ties keep the original priority order.
+    return sorted(_EDU_ITEM_SELECTORS, key=lambda sel: -_edu_item_selector_hits[sel])
+
+
+_SCHOOL_LINK_SELECTOR = soupsieve.compile('a[href*="/school/" i]')
+_EDU_DETAILS_LINK_SELECTOR = soupsieve.compile('a[href*="/details/education" i]')
+# Entry-level selectors reused for every experience/education card.
+_ENTITY_SELECTOR = soupsieve.compile('div[data-view-name="profile-component-entity"]')
+_BOLD_TEXT_SELECTOR = soupsieve.compile('.t-bold span[aria-hidden="true"]')
+_BOLD_SELECTOR = soupsieve.compile('.t-bold')
+_COMPANY_LINE_SELECTOR = soupsieve.compile('span.t-14.t-normal:not(.t-black--light)')
+_ARIA_HIDDEN_SPAN_SELECTOR = soupsieve.compile('span[aria-hidden="true"]')
+# Elements _p_texts_clean drops from a container before reading its lines.
+_P_TEXT_HIDDEN_SELECTOR = soupsieve.compile("[data-testid='expandable-text-box'], .visually-hidden")
+_DATE_LINE_SELECTOR = soupsieve.compile(
+    'span.pvs-entity__caption-wrapper[aria-hidden="true"], span.t-black--light span[aria-hidden="true"]'
+)
+
+
+@lru_cache(maxsize=None)
+def _heading_text_re(norm_heading: str):
+    """Whole-string, case-insensitive match for a section heading text node."""
+    return re.compile(rf"^\s*{re.escape(norm_heading)}\s*$", re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def _section_marker_selector(norm_heading: str):
+    """Compiled selector for section/div containers tagged with a heading's component markers."""
+    markers = (
+        f"{norm_heading}toplevelsection",
+        f"profile_{norm_heading}_top_anchor",
+        f"/details/{norm_heading}",
+    )
+    return soupsieve.compile(", ".join(
+        f'{tag}[{attr}*="{marker}" i]'
+        for tag in ("section", "div")
+        for attr in ("componentkey", "id", "data-view-name", "aria-label")
+        for marker in markers
+    ))
+
+
 _NAME_SUFFIX_TOKENS = {"ii", "iii", "iv", "v", "vi", "vii", "viii", "ix", "x"}
 _UNT_SCHOOL_ID = "6464"
 
@@ -224,6 +440,17 @@ class LinkedInScraper:
         self.driver = None
         self.wait = None
         self._current_profile_url = ""
+        # Seconds the last scrape spent loading the profile page; the caller's
+        # pacing delay counts this time instead of adding to it.
+        self.last_profile_load_seconds = 0.0
+        self._profiles_since_memory_release = 0
+        # (soup, [(heading, lowered text), ...]) for the page being scraped, so
+        # Education and Experience share one heading scan; cleared after each
+        # profile so no finished page's tree outlives its scrape.
+        self._section_headings_cache = None
+        # Background worker for Groq calls whose input is already known, so the
+        # LLM round-trip can overlap browser work; created on first use.
+        self._groq_prefetch_pool = None
 
     # ============================================================
     # Selenium Setup & Auth
@@ -240,39 +467,96 @@ class LinkedInScraper:
         chrome_options.add_argument("--disable-dev-shm-usage")
         # Blocks some automated detection by disabling the 'navigator.webdriver' flag.
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        # Return from driver.get() at DOMContentLoaded; explicit waits cover the rest.
+        chrome_options.page_load_strategy = "eager"
+        if config.BLOCK_IMAGES:
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            })
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
 
-        self.driver = webdriver.Chrome(options=chrome_options)
+        # Reuse one HTTP connection to chromedriver for every driver command
+        # instead of paying a TCP handshake per find_element/execute_script.
+        self.driver = webdriver.Chrome(options=chrome_options, keep_alive=True)
         self.wait = WebDriverWait(self.driver, 10)
+        # Upper bound for the in-browser full-page scroll (see scroll_full_page).
+        self.driver.set_script_timeout(20)
         logger.info("✓ WebDriver initialized")
 
+    def _wait_for_page_ready(self, css="main", timeout=8):
+        """Wait until ``css`` is present instead of sleeping a fixed interval."""
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, css))
+            )
+            return True
+        except Exception:
+            return False
+
     def _load_cookies(self):
         try:
             if not config.COOKIES_FILE.exists():
                 return False
 
             logger.info("Loading saved cookies...")
-            self.driver.get("https://www.linkedin.com")
-            time.sleep(2)
-
-            cookies = json.loads(config.COOKIES_FILE.read_text(encoding="utf-8"))
+            raw = config.COOKIES_FILE.read_bytes()
+            cookies = _orjson.loads(raw) if _orjson is not None else json.loads(raw)
+            cookies = [
+                {key: value for key, value in cookie.items() if key != 'sameSite'}
+                for cookie in cookies
+            ]
 
-            for cookie in cookies:
-                try:
-                    if 'expiry' in cookie:
-                        cookie['expiry'] = int(cookie['expiry'])
-                    cookie.pop('sameSite', None)
-                    self.driver.add_cookie(cookie)
-                except Exception:
-                    pass
+            # One CDP call sets the whole jar without first loading linkedin.com;
+            # fall back to per-cookie add_cookie (which needs the domain open).
+            if not self._set_cookies_via_cdp(cookies):
+                self.driver.get("https://www.linkedin.com")
+                self._wait_for_page_ready("body")
+                for cookie in cookies:
+                    try:
+                        if 'expiry' in cookie:
+                            cookie['expiry'] = int(cookie['expiry'])
+                        self.driver.add_cookie(cookie)
+                    except Exception:
+                        pass
 
             logger.info(f"✓ Loaded {len(cookies)} cookies")
             self.driver.get("https://www.linkedin.com/feed")
-            time.sleep(3)
+            self._wait_for_page_ready()
             return "feed" in (self.driver.current_url or "")
         except Exception as e:
             logger.warning(f"Error loading cookies: {e}")
             return False
 
+    def _set_cookies_via_cdp(self, cookies):
+        params = []
+        for cookie in cookies:
+            if not cookie.get('name'):
+                continue
+            entry = {
+                "name": cookie['name'],
+                "value": cookie.get('value', ""),
+                "path": cookie.get('path') or "/",
+                "secure": bool(cookie.get('secure')),
+                "httpOnly": bool(cookie.get('httpOnly')),
+            }
+            if cookie.get('domain'):
+                entry["domain"] = cookie['domain']
+            else:
+                entry["url"] = "https://www.linkedin.com"
+            if 'expiry' in cookie:
+                try:
+                    entry["expires"] = int(cookie['expiry'])
+                except (TypeError, ValueError):
+                    pass
+            params.append(entry)
+        try:
+            self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": params})
+            return True
+        except Exception as e:
+            logger.debug(f"CDP cookie load unavailable, using add_cookie: {e}")
+            return False
+
     def _save_cookies(self):
         try:
             cookies = self.driver.get_cookies()
@@ -289,7 +573,6 @@ class LinkedInScraper:
 
         try:
             self.driver.get("https://www.linkedin.com/login")
-            time.sleep(2)
 
             email_field = self.wait.until(EC.presence_of_element_located((By.ID, "username")))
             email_field.send_keys(config.LINKEDIN_EMAIL)
@@ -302,7 +585,7 @@ class LinkedInScraper:
             password_field.send_keys(Keys.RETURN)
 
             self.wait.until(EC.url_contains("feed"))
-            time.sleep(3)
+            self._wait_for_page_ready()
 
             logger.info("✓ Logged in successfully")
             self._save_cookies()
@@ -363,10 +646,19 @@ class LinkedInScraper:
         }
 
     def quit(self):
+        if self._groq_prefetch_pool is not None:
+            self._groq_prefetch_pool.shutdown(wait=False)
+            self._groq_prefetch_pool = None
         if self.driver:
             self.driver.quit()
             logger.info("✓ WebDriver closed")
 
+    def _submit_groq_prefetch(self, fn, *args, **kwargs):
+        """Run ``fn`` on the background Groq worker, creating it on first use."""
+        if self._groq_prefetch_pool is None:
+            self._groq_prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="groq-prefetch")
+        return self._groq_prefetch_pool.submit(fn, *args, **kwargs)
+
     # ============================================================
     # Navigation & Waits
     # ============================================================
@@ -417,6 +709,65 @@ class LinkedInScraper:
             edge,
         )
 
+    def _scroll_full_page_in_browser(self):
+        """Run the whole down/up scroll sequence in one async script (one driver round-trip)."""
+        return self.driver.execute_async_script(
+            """
+            const done = arguments[arguments.length - 1];
+            const rand = (lo, hi) => lo + Math.random() * (hi - lo);
+            const surfaces = () => Array.from(document.querySelectorAll('main, section, div, ul')).filter((el) => {
+                const style = window.getComputedStyle(el);
+                const overflowY = (style.overflowY || '').toLowerCase();
+                const canScroll = ['auto', 'scroll', 'overlay'].includes(overflowY);
+                return canScroll && (el.scrollHeight - el.clientHeight) > 200;
+            }).sort((left, right) => (
+                (right.scrollHeight - right.clientHeight) - (left.scrollHeight - left.clientHeight)
+            )).slice(0, 6);
+            const scrollBy = (delta) => {
+                const before = window.scrollY;
+                window.scrollBy(0, delta);
+                let moved = window.scrollY !== before;
+                for (const el of surfaces()) {
+                    const maxTop = Math.max(0, el.scrollHeight - el.clientHeight);
+                    const prevTop = el.scrollTop;
+                    el.scrollTop = Math.max(0, Math.min(maxTop, el.scrollTop + delta));
+                    if (el.scrollTop !== prevTop) moved = true;
+                }
+                return moved;
+            };
+            const toEdge = (toTop) => {
+                window.scrollTo(0, toTop ? 0 : Math.max(document.body.scrollHeight, document.documentElement.scrollHeight));
+                for (const el of surfaces()) {
+                    el.scrollTop = toTop ? 0 : Math.max(0, el.scrollHeight - el.clientHeight);
+                }
+            };
+
+            const steps = [];
+            for (let i = 0; i < 5; i++) steps.push([() => scrollBy(900), rand(500, 900), 'down']);
+            steps.push([() => toEdge(false), rand(800, 1200)]);
+            for (let i = 0; i < 2; i++) steps.push([() => scrollBy(-1200), rand(400, 700)]);
+            steps.push([() => toEdge(true), 500]);
+
+            let index = 0;
+            const next = () => {
+                if (index >= steps.length) { done(true); return; }
+                const [step, pause, phase] = steps[index++];
+                let moved = true;
+                try { moved = step() !== false; } catch (e) {}
+                if (phase === 'down' && !moved) {
+                    // Short page: already at the bottom, so the remaining
+                    // downward steps would only sleep. Go straight to the
+                    // bottom-edge step, which still waits for lazy sections.
+                    while (index < steps.length && steps[index][2] === 'down') index++;
+                    next();
+                    return;
+                }
+                setTimeout(next, pause);
+            };
+            next();
+            """
+        )
+
     def scroll_full_page(self):
         """
         Scroll the full LinkedIn page down and back up.
@@ -424,6 +775,13 @@ class LinkedInScraper:
         and Experience) are lazy-loaded and only appear in the DOM when scrolled into view.
         """
         logger.debug("Scrolling page...")
+        try:
+            if self._scroll_full_page_in_browser():
+                return
+        except Exception:
+            pass
+
+        # Step-by-step fallback (one driver command per scroll).
         try:
             for _ in range(5):
                 self._scroll_active_surfaces(900)
@@ -443,19 +801,28 @@ class LinkedInScraper:
 
     def extract_profile_urls_from_page(self):
         logger.debug("Extracting profile URLs...")
-        soup = BeautifulSoup(self.driver.page_source, "html.parser")
+        page_source = self.driver.page_source
+        hrefs = None
+        if _lxml_html is not None:
+            try:
+                hrefs = _PROFILE_HREFS_XPATH(_lxml_html.fromstring(page_source))
+            except Exception as e:
+                logger.debug(f"lxml profile-link scan failed, using BeautifulSoup: {e}")
+        if hrefs is None:
+            soup = BeautifulSoup(page_source, _HTML_PARSER, parse_only=_PROFILE_ANCHOR_STRAINER)
+            hrefs = [anchor.get("href") for anchor in soup.find_all("a")]
         profile_urls = []
         seen = set()
 
         # Keep DOM order so the scraper processes links as they appear on the page.
-        for anchor in soup.select("a[href*='/in/']"):
-            href = (anchor.get("href") or "").strip()
+        for href in hrefs:
+            href = (href or "").strip()
             if not href:
                 continue
 
             # Canonicalize to the public profile slug and drop tracking params.
             # This avoids queue churn from miniProfile and query-variant links.
-            match = re.search(r"/in/([^/?#]+)", href)
+            match = _PROFILE_SLUG_RE.search(href)
             if not match:
                 continue
             url = f"https://www.linkedin.com/in/{match.group(1).strip()}".rstrip("/")
@@ -477,6 +844,28 @@ class LinkedInScraper:
     def _wait_for_top_card(self, timeout=10):
         """Wait for the Name to appear (h1/h2)."""
         end = time.time() + timeout
+        try:
+            # Poll inside the page so we return as soon as the name renders,
+            # using one driver round-trip instead of one per 0.5s tick.
+            return bool(self.driver.execute_async_script("""
+                const done = arguments[arguments.length - 1];
+                const deadline = Date.now() + arguments[0];
+                const ready = () => {
+                    const main = document.querySelector('main');
+                    const h1 = main && main.querySelector('h1');
+                    const text = ((h1 && h1.innerText) || '').trim().toLowerCase();
+                    return text.length >= 2 && !text.includes('notification');
+                };
+                const tick = () => {
+                    if (ready()) { done(true); return; }
+                    if (Date.now() >= deadline) { done(false); return; }
+                    setTimeout(tick, 100);
+                };
+                tick();
+            """, int(timeout * 1000)))
+        except Exception:
+            pass
+
         while time.time() < end:
             try:
                 ok = self.driver.execute_script("""
@@ -506,6 +895,40 @@ class LinkedInScraper:
     def _wait_for_education_ready(self, timeout=15):
         """Wait for the Education section to become available."""
         end = time.time() + timeout
+        try:
+            # Same check as the loop below, polled in the page; nudges the
+            # scroll every 0.5s to trigger lazy rendering.
+            return bool(self.driver.execute_async_script("""
+                const done = arguments[arguments.length - 1];
+                const deadline = Date.now() + arguments[0];
+                let lastNudge = 0;
+                const ready = () => {
+                    const m = document.querySelector('main') || document.body;
+                    const h = Array.from(m.querySelectorAll('h2,h3,span'))
+                        .find(x => (x.innerText || '').trim().toLowerCase().includes('education'));
+                    return Boolean(h || m.querySelector('a[href*="/school/"]'));
+                };
+                const tick = () => {
+                    if (ready()) { done(true); return; }
+                    if (Date.now() >= deadline) { done(false); return; }
+                    if (Date.now() - lastNudge >= 500) {
+                        lastNudge = Date.now();
+                        window.scrollBy(0, 300);
+                        Array.from(document.querySelectorAll('main, section, div, ul')).filter((el) => {
+                            const overflowY = (window.getComputedStyle(el).overflowY || '').toLowerCase();
+                            return ['auto', 'scroll', 'overlay'].includes(overflowY)
+                                && (el.scrollHeight - el.clientHeight) > 200;
+                        }).slice(0, 6).forEach((el) => {
+                            el.scrollTop = Math.min(el.scrollHeight - el.clientHeight, el.scrollTop + 300);
+                        });
+                    }
+                    setTimeout(tick, 100);
+                };
+                tick();
+            """, int(timeout * 1000)))
+        except Exception:
+            pass
+
         while time.time() < end:
             try:
                 # Scroll a bit if not found yet to trigger render
@@ -600,15 +1023,43 @@ class LinkedInScraper:
         }
 
     def scrape_profile_page(self, profile_url):
+        """Scrape one profile, releasing browser memory every few completed scrapes."""
+        self.last_profile_load_seconds = 0.0
+        try:
+            data = self._scrape_profile_page(profile_url)
+        finally:
+            # The headings cache references the page soup; drop it with the page.
+            self._section_headings_cache = None
+        if isinstance(data, dict):
+            # Only after a complete scrape: checkpoint/sign-in results must leave
+            # the page in place for manual intervention.
+            self._profiles_since_memory_release += 1
+            if self._profiles_since_memory_release >= _BROWSER_MEMORY_RELEASE_EVERY:
+                self._release_browser_memory()
+        return data
+
+    def _release_browser_memory(self):
+        self._profiles_since_memory_release = 0
+        try:
+            self.driver.get("about:blank")
+            self.driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+            logger.debug("Released browser page memory")
+        except Exception as e:
+            logger.debug(f"Browser memory release skipped: {e}")
+
+    def _scrape_profile_page(self, profile_url):
         data = self._initialize_profile_data(profile_url)
+        edu_groq_future = None
 
         try:
             logger.debug(f"Opening profile: {profile_url}")
+            load_started = time.monotonic()
             self.driver.get(profile_url)
             self._force_focus()
             
             # Initial settle
-            time.sleep(2)
+            self._wait_for_page_ready()
+            self.last_profile_load_seconds = time.monotonic() - load_started
 
             current_url = (self.driver.current_url or "").strip()
             if not self._looks_like_profile_url(current_url):
@@ -620,7 +1071,7 @@ class LinkedInScraper:
                 )
                 self.driver.get(profile_url)
                 self._force_focus()
-                time.sleep(2)
+                self._wait_for_page_ready()
                 current_url = (self.driver.current_url or "").strip()
                 if not self._looks_like_profile_url(current_url):
                     logger.warning("Could not reach profile page after retry: %s", profile_url)
@@ -664,7 +1115,7 @@ class LinkedInScraper:
             if not found_edu:
                 logger.debug("Education section not detected quickly (might be missing or different layout).")
 
-            soup = BeautifulSoup(self.driver.execute_script("return document.body.innerHTML;"), "html.parser")
+            soup = BeautifulSoup(self.driver.execute_script("return document.body.innerHTML;"), _HTML_PARSER)
 
             # 3. Top Card
             name, headline, location = self._extract_top_card(soup)
@@ -684,6 +1135,24 @@ class LinkedInScraper:
             data["headline"] = headline
             data["location"] = location or "Not Found"
 
+            # Cheap pre-filter before the Groq/CSS experience and education work:
+            # with no UNT mention on the rendered page and no hidden entries
+            # behind "Show all education", the UNT check below cannot pass.
+            if not self._page_may_mention_unt(soup):
+                logger.debug("No UNT mention on %s; skipping detailed extraction.", canonical_url or profile_url)
+                return self._not_unt_result(data, profile_url)
+
+            # Groq education extraction only needs the main-page Education
+            # section, so start it now and let it overlap experience extraction
+            # and the detailed education navigation below.
+            edu_root = self._find_section_root(soup, "Education")
+            if edu_root and is_groq_available():
+                edu_groq_future = self._submit_groq_prefetch(
+                    extract_education_with_groq,
+                    str(edu_root),
+                    profile_name=data.get("name", "unknown"),
+                )
+
             # 4. Experience - Get up to 3 entries
             all_experiences = self._extract_all_experiences(soup, max_entries=3, profile_name=name)
             _total_tokens = getattr(self, '_last_exp_tokens', 0)  # From Groq experience extraction
@@ -705,14 +1174,16 @@ class LinkedInScraper:
             if detailed_entries:
                 edu_entries = self._merge_education_entries(edu_entries, detailed_entries)
 
-            edu_root = self._find_section_root(soup, "Education")
             if is_groq_available():
                 if edu_root:
                     edu_html = str(edu_root)
-                    groq_results, edu_tokens = extract_education_with_groq(
-                        edu_html,
-                        profile_name=data.get("name", "unknown"),
-                    )
+                    if edu_groq_future is not None:
+                        groq_results, edu_tokens = edu_groq_future.result()
+                    else:
+                        groq_results, edu_tokens = extract_education_with_groq(
+                            edu_html,
+                            profile_name=data.get("name", "unknown"),
+                        )
                     if groq_results and self._education_entries_exceed_cloud_limits(groq_results):
                         logger.warning(
                             "Groq education output exceeded cloud field limits for %s. Retrying once in strict mode.",
@@ -767,7 +1238,7 @@ class LinkedInScraper:
             # (activities text contains "UNT" which falsely passes _is_unt_school_name)
             edu_entries = [
                 e for e in edu_entries
-                if not re.match(r'^\s*Activities and societies:', e.get("school", ""), re.IGNORECASE)
+                if not _ACTIVITIES_PREFIX_RE.match(e.get("school", ""))
             ]
 
             data["all_education"] = list(dict.fromkeys([e["school"] for e in edu_entries if e.get("school")]))
@@ -824,8 +1295,13 @@ class LinkedInScraper:
             else:
                 # If we have NO education entries, or just no UNT, try expanding
                 if not edu_entries or not self._has_unt_education(edu_entries):
-                    logger.debug("No UNT education found in main profile. Expanding...")
-                    expanded_edus, unt_details = self.scrape_all_education(profile_url)
+                    if detailed_entries:
+                        # The expanded education page was already read and merged
+                        # above; opening it again would repeat the same extraction.
+                        expanded_edus, unt_details = [], None
+                    else:
+                        logger.debug("No UNT education found in main profile. Expanding...")
+                        expanded_edus, unt_details = self.scrape_all_education(profile_url, soup=soup)
                     
                     if expanded_edus:
                         data["all_education"] = list(dict.fromkeys(expanded_edus))
@@ -868,22 +1344,14 @@ class LinkedInScraper:
                         # This pipeline intentionally stores UNT alumni only.
                         # If neither inline extraction nor expanded education view finds UNT,
                         # skip persisting this profile.
-                        return {
-                            "__status__": "NOT_UNT_ALUM",
-                            "profile_url": data.get("profile_url", profile_url),
-                            "_original_url": data.get("_original_url", ""),
-                            "name": data.get("name", ""),
-                        }
+                        return self._not_unt_result(data, profile_url)
 
             # --- Store up to 3 education entries (school2/degree2/major2, etc.) ---
             # Trust the extraction layer (Groq/CSS) to return clean entries.
             # Only exclude the primary entry itself.
+            # edu_entries was already filtered for "Activities and societies" text above.
             primary_entry = best_unt if best_unt else None
-            other_entries = [
-                e for e in edu_entries
-                if e is not primary_entry
-                and not re.match(r'^\s*Activities and societies:', e.get("school", ""), re.IGNORECASE)
-            ]
+            other_entries = [e for e in edu_entries if e is not primary_entry]
             for i, entry in enumerate(other_entries[:2], start=2):
                 data[f"school{i}"] = entry.get("school", "")
                 data[f"degree{i}"] = entry.get("degree", "").strip()
@@ -919,6 +1387,14 @@ class LinkedInScraper:
         except Exception as e:
             logger.error(f"Error scraping profile {profile_url}: {e}")
             return None
+        finally:
+            # Errors and early returns must not leave the prefetch running into
+            # the next profile: cancel it if still queued, otherwise wait it out.
+            if edu_groq_future is not None and not edu_groq_future.cancel():
+                try:
+                    edu_groq_future.result()
+                except Exception as e:
+                    logger.debug(f"Discarded Groq education prefetch failed: {e}")
 
     def _apply_experience_entries(self, data, all_experiences):
         """
@@ -1224,7 +1700,7 @@ class LinkedInScraper:
             return True
 
         lowered = company.casefold()
-        if lowered in {"remote", "hybrid", "on-site", "onsite"}:
+        if lowered in _WORK_ARRANGEMENT_TOKENS:
             return True
 
         if len(company) > 140:
@@ -1238,17 +1714,8 @@ class LinkedInScraper:
         ):
             return True
 
-        token_count = len(re.findall(r"[a-z0-9]+", lowered))
-        has_company_signal = bool(
-            re.search(
-                r"\b(inc|llc|ltd|corp|company|co\.?|technologies|technology|systems|solutions|"
-                r"group|partners|health|hospital|university|college|school|institute|"
-                r"laboratory|lab|bureau|foundation|association)\b",
-                lowered,
-                re.IGNORECASE,
-            )
-        )
-        if token_count >= 14 and not has_company_signal:
+        tokens = re.findall(r"[a-z0-9]+", lowered)
+        if len(tokens) >= 14 and _COMPANY_SIGNAL_TOKENS.isdisjoint(tokens):
             return True
 
         return False
@@ -1263,14 +1730,31 @@ class LinkedInScraper:
     # ============================================================
     # Missing-date fallback (strict UNT + Graduate Assistant)
     # ============================================================
-    _UNT_FULL_NAME_RE = re.compile(r'university\s+of\s+north\s+texas', re.IGNORECASE)
-    _UNT_TOKEN_RE = re.compile(r'\bunt\b', re.IGNORECASE)
+    # Full name or standalone "UNT" in one pass; search() stops at the first hit.
+    _UNT_NAME_RE = re.compile(r'university\s+of\s+north\s+texas|\bunt\b', re.IGNORECASE)
     _SCHOOL_ID_RE = re.compile(r"/school/(\d+)", re.IGNORECASE)
 
+    def _page_may_mention_unt(self, soup) -> bool:
+        if self._find_show_all_education_link(soup):
+            return True
+        for anchor in _SCHOOL_LINK_SELECTOR.select(soup):
+            if self._is_unt_school_href(anchor.get("href") or ""):
+                return True
+        return self._is_unt_school_name(soup.get_text(" "))
+
+    @staticmethod
+    def _not_unt_result(data, profile_url):
+        return {
+            "__status__": "NOT_UNT_ALUM",
+            "profile_url": data.get("profile_url", profile_url),
+            "_original_url": data.get("_original_url", ""),
+            "name": data.get("name", ""),
+        }
+
     def _is_unt_school_name(self, name: str) -> bool:
         if not name:
             return False
-        return bool(self._UNT_FULL_NAME_RE.search(name) or self._UNT_TOKEN_RE.search(name))
+        return bool(self._UNT_NAME_RE.search(name))
 
     def _school_id_from_href(self, href: str) -> str:
         match = self._SCHOOL_ID_RE.search(href or "")
@@ -1283,12 +1767,8 @@ class LinkedInScraper:
         if not raw_company or not raw_company.strip():
             return False
 
-        company = " ".join(raw_company.split())
-        if self._UNT_FULL_NAME_RE.search(company):
-            return True
-        if re.search(r'^\s*unt\s+', company, re.IGNORECASE):
-            return True
-        return bool(self._UNT_TOKEN_RE.search(company))
+        # A leading "UNT ..." is already covered by the \bunt\b alternative.
+        return bool(self._UNT_NAME_RE.search(" ".join(raw_company.split())))
 
     def _has_unt_education(self, edu_entries) -> bool:
         if not edu_entries:
@@ -1560,52 +2040,31 @@ class LinkedInScraper:
         raw_location = ""
         source_root = soup.find("main") or soup
 
-        def _has_region_location_keywords(value):
-            text = (value or "").lower()
-            return any(keyword in text for keyword in [
-                "metropolitan area",
-                "metro area",
-                "metroplex",
-                "bay area",
-                " metro",
-                "greater ",
-                " region",
-                " county",
-                "silicon valley",
-                "tri-state",
-                "inland empire",
-                "puget sound",
-                "research triangle",
-                "twin cities",
-                "chicagoland",
-                "hampton roads",
-                "south florida",
-            ])
-        
         # Name - prefer H1/H2 inside <main>, ignore global navigation headings.
+        top_card_nodes = _collect_top_card_nodes(source_root)
         for tag_name in ("h1", "h2"):
             if name:
                 break
-            for tag in source_root.find_all(tag_name):
+            for tag in top_card_nodes[tag_name]:
                 candidate = tag.get_text(" ", strip=True)
-                candidate = re.sub(r"\s*\(.*?\)\s*$", "", candidate).strip()
+                candidate = _TRAILING_PARENTHETICAL_RE.sub("", candidate).strip()
                 if not self._looks_like_person_name(candidate):
                     continue
                 name = candidate
                 break
 
         # Headline - Look for 'text-body-medium' class (LinkedIn's current pattern)
-        for div in source_root.find_all("div", class_=lambda x: x and "text-body-medium" in x):
+        for div in top_card_nodes["headline"]:
             text = div.get_text(" ", strip=True)
             if text and len(text) > 5 and len(text) < 200:
                 # Skip if it looks like a date or connection badge
-                if not re.search(r'^\d{4}|^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)', text):
+                if not _HEADLINE_DATE_PREFIX_RE.search(text):
                     headline = text
                     break
         
         # Fallback: Look for headline in data-generated-suggestion-target attribute area
         if not headline:
-            for div in source_root.find_all("div", {"data-generated-suggestion-target": True}):
+            for div in top_card_nodes["suggestion"]:
                 text = div.get_text(" ", strip=True)
                 if text and len(text) > 5:
                     headline = text
@@ -1615,14 +2074,9 @@ class LinkedInScraper:
         # Filter out school/company badges based on class patterns:
         # - Badges have parent div with class "inline-show-more-text"
         # - Real location has class "text-body-small inline t-black--light"
-        location_blacklist = ["university", "college", "school", "institute", 
-                              "inc", "corp", "llc", "company", "technologies", "solutions",
-                              "enterprises", "consulting", "software", "systems", "group"]
-        
-        # Initialize classifier before the loop so it's available in fallback code below
-        classifier = get_classifier()
-
-        for span in source_root.find_all(["span", "div"], class_=lambda x: x and "text-body-small" in x):
+        # is_location() memoizes its verdicts, so repeated candidates across
+        # profiles ("United States", "Dallas-Fort Worth Metroplex") are free.
+        for span in top_card_nodes["small_text"]:
             # Check if this is inside a badge container (inline-show-more-text div)
             parent_div = span.find_parent("div")
             if parent_div:
@@ -1636,15 +2090,14 @@ class LinkedInScraper:
             is_location_styled = "inline" in span_class and "t-black--light" in span_class
             
             text = span.get_text(" ", strip=True)
-            text = re.sub(r"\s*[·|]\s*Contact info\s*$", "", text, flags=re.IGNORECASE).strip()
-            text_lower = text.lower()
-            
-            # Skip badge-like entries (schools, companies)
-            if any(x in text_lower for x in location_blacklist):
+            text = _CONTACT_INFO_SUFFIX_RE.sub("", text).strip()
+            if not text:
                 continue
+            text_lower = text.lower()
             
-            # Skip connection/follower/contact and employment-type text
-            if any(x in text_lower for x in ["connection", "follower", "contact info", "full-time", "part-time", "contract", "internship"]):
+            # Skip badge-like entries (schools, companies) and connection/follower/
+            # contact or employment-type text in a single scan.
+            if _LOCATION_REJECT_RE.search(text_lower):
                 continue
             
             # Valid location patterns:
@@ -1652,61 +2105,48 @@ class LinkedInScraper:
             # 2. Contains specific location keywords like "metroplex", "area"
             # 3. Contains country names
             has_comma = "," in text
-            has_location_keyword = _has_region_location_keywords(text)
-            has_country = any(x in text_lower for x in [
-                "united states", "india", "canada", "uk", "united kingdom",
-                "germany", "australia", "france", "japan", "china", "brazil", "mexico",
-                "saudi arabia", "uae", "united arab emirates", "qatar", "kuwait",
-                "bahrain", "oman", "jordan", "egypt", "turkey", "pakistan",
-                "bangladesh", "sri lanka", "nepal", "malaysia", "singapore",
-                "indonesia", "philippines", "vietnam", "thailand", "south korea",
-                "nigeria", "kenya", "ghana", "south africa", "ethiopia",
-                "italy", "spain", "netherlands", "belgium", "switzerland",
-                "sweden", "norway", "denmark", "finland", "poland",
-                "ireland", "new zealand", "portugal", "greece",
-            ])
-
-            if not raw_location and (is_location_styled or has_comma or has_location_keyword or has_country):
+            has_country = bool(_COUNTRY_HINT_RE.search(text_lower))
+
+            if not raw_location and (
+                is_location_styled or has_comma or has_country or _REGION_LOCATION_RE.search(text_lower)
+            ):
                 raw_location = text
             
-            if classifier.is_location(text):
+            if is_location(text):
                 location = text
                 break
             
-            # If not obvious from heuristics, use Groq if available
+            # If not obvious from heuristics, use Groq if available.
+            # raw_location was already captured above for any candidate that
+            # reaches this branch, so only the verification remains.
             if (is_location_styled or has_comma or has_country) and is_groq_available():
-                # Potential location, verify with Groq
                 if verify_location(text):
                     location = text
                     break
-                if not raw_location:
-                    raw_location = text
-            elif not raw_location and (has_comma or has_location_keyword or has_country):
-                raw_location = text
 
         # Contact-info adjacency fallback for top-card layouts where location is not
         # rendered inside the expected text-body-small span.
         if not location:
-            contact_nodes = source_root.find_all(
-                ["a", "span", "div"],
-                string=re.compile(r"contact info", re.IGNORECASE),
-            )
-            for node in contact_nodes:
+            # Neighbouring contact-info anchors share ancestors; classify each element once.
+            seen_candidates = set()
+            for node in top_card_nodes["contact_info"]:
                 for prev in node.find_all_previous(["span", "div"], limit=6):
+                    if id(prev) in seen_candidates:
+                        continue
+                    seen_candidates.add(id(prev))
                     candidate = prev.get_text(" ", strip=True)
-                    candidate = re.sub(r"\s*[·|]\s*Contact info\s*$", "", candidate, flags=re.IGNORECASE).strip()
+                    candidate = _CONTACT_INFO_SUFFIX_RE.sub("", candidate).strip()
                     if not candidate:
                         continue
-                    if any(token in candidate.lower() for token in [
-                        "connection", "follower", "company", "full-time", "part-time", "contract", "internship"
-                    ]):
+                    candidate_lower = candidate.lower()
+                    if _CONTACT_NEIGHBOR_NOISE_RE.search(candidate_lower):
                         continue
-                    if classifier.is_location(candidate):
+                    if is_location(candidate):
                         location = candidate
                         break
                     if (
-                        ("," in candidate or _has_region_location_keywords(candidate))
-                        and not any(token in candidate.lower() for token in ["university", "college", "school", "institute"])
+                        ("," in candidate or _REGION_LOCATION_RE.search(candidate_lower))
+                        and not _EDU_INSTITUTION_RE.search(candidate_lower)
                     ):
                         location = candidate
                         break
@@ -1721,12 +2161,8 @@ class LinkedInScraper:
             rl_lower = raw_location.lower()
             geo_accept = (
                 "," in raw_location
-                or _has_region_location_keywords(raw_location)
-                or any(c in rl_lower for c in [
-                    "united states", "india", "canada", "remote",
-                    "united kingdom", "germany", "australia", "france",
-                    "saudi arabia", "uae", "japan", "china", "brazil", "mexico",
-                ])
+                or _REGION_LOCATION_RE.search(rl_lower)
+                or _FALLBACK_GEO_RE.search(rl_lower)
             )
             if geo_accept:
                 location = raw_location
@@ -1833,7 +2269,7 @@ class LinkedInScraper:
         # ============================================================
         # Find experience entry containers - they have data-view-name="profile-component-entity"
         # or are within an anchor that links to experience details
-        experience_containers = exp_root.select('div[data-view-name="profile-component-entity"]')
+        experience_containers = _ENTITY_SELECTOR.select(exp_root)
         
         # Also try finding by the link pattern (experience entries usually have links)
         if not experience_containers:
@@ -1850,18 +2286,15 @@ class LinkedInScraper:
             
             # Job Title: Look for t-bold class
             # Prefer inner span to avoid doubled text from parent div
-            title_elem = container.select_one('.t-bold span[aria-hidden="true"]') or container.select_one('.t-bold')
+            title_elem = _BOLD_TEXT_SELECTOR.select_one(container) or _BOLD_SELECTOR.select_one(container)
             if title_elem:
-                title = _clean_doubled(title_elem.get_text(strip=True))
+                title = _clean_doubled(_leaf_text(title_elem))
             
             # Company + Employment Type: Look for t-14 t-normal (not t-black--light)
-            company_spans = container.select('span.t-14.t-normal:not(.t-black--light)')
+            company_spans = _COMPANY_LINE_SELECTOR.select(container)
             for span in company_spans:
-                text_elem = span.select_one('span[aria-hidden="true"]')
-                if text_elem:
-                    text = text_elem.get_text(strip=True)
-                else:
-                    text = span.get_text(strip=True)
+                text_elem = _ARIA_HIDDEN_SPAN_SELECTOR.select_one(span)
+                text = _leaf_text(text_elem or span)
                 
                 # This could be "Company · Part-time" / "… · Internship" format
                 if text and not utils.DATE_RANGE_RE.search(text):
@@ -1870,16 +2303,19 @@ class LinkedInScraper:
                         segs = [s.strip() for s in text.split("·")]
                         if len(segs) >= 2 and _EMP_LINE_TAIL.match(segs[-1]):
                             emp_css = segs[-1]
-                    candidate_company = _clean_doubled(text.strip())
+                    candidate_company = _clean_doubled(text)
                     from entity_classifier import is_location
                     if is_location(candidate_company):
                         parent_ul = container.find_parent('ul')
                         if parent_ul:
                             outer_container = parent_ul.find_parent('div', attrs={'data-view-name': 'profile-component-entity'})
                             if outer_container:
-                                outer_title_elem = outer_container.select_one('.t-bold span[aria-hidden="true"]') or outer_container.select_one('.t-bold')
+                                outer_title_elem = (
+                                    _BOLD_TEXT_SELECTOR.select_one(outer_container)
+                                    or _BOLD_SELECTOR.select_one(outer_container)
+                                )
                                 if outer_title_elem:
-                                    candidate_company = _clean_doubled(outer_title_elem.get_text(strip=True).strip())
+                                    candidate_company = _clean_doubled(_leaf_text(outer_title_elem))
                                     emp_css = ""
                     if self._looks_like_company_noise(candidate_company):
                         continue
@@ -1888,9 +2324,9 @@ class LinkedInScraper:
                     break
             
             # Dates: Look for pvs-entity__caption-wrapper or t-black--light
-            date_spans = container.select('span.pvs-entity__caption-wrapper[aria-hidden="true"], span.t-black--light span[aria-hidden="true"]')
+            date_spans = _DATE_LINE_SELECTOR.select(container)
             for span in date_spans:
-                text = span.get_text(strip=True)
+                text = _leaf_text(span)
                 if utils.DATE_RANGE_RE.search(text):
                     start_d, end_d = utils.parse_date_range_line(text)
                     if start_d and end_d:
@@ -1974,44 +2410,19 @@ class LinkedInScraper:
         if seen_entries is None:
             seen_entries = set()
             
-        # Patterns to filter OUT (these are not company/title)
-        junk_patterns = re.compile(
-            r'^(Full-time|Part-time|Contract|Internship|Freelance|Self-employed|Seasonal|Temporary|Remote|Hybrid|On-site)$|'
-            r'^\d+\s*(yr|yrs|year|years|mo|mos|month|months)\b|'
-            r'^·\s*\d+\s*(yr|yrs|mo|mos)|'
-            r'^\d+\s*(yr|yrs)?\s*\d*\s*(mo|mos)?$',
-            re.I
-        )
-        
-        # Company indicator patterns
-        company_hints = re.compile(
-            r'\b(Inc\.?|Corp\.?|LLC|Ltd\.?|Company|Co\.?|Technologies|Solutions|Enterprises|Group|Partners|Services|Consulting|Software|Systems|S\.?R\.?L\.?)(?=\W|$)',
-            re.I
-        )
-        
-        # Job title indicator patterns  
-        title_hints = re.compile(
-            r'\b(Engineer|Developer|Manager|Director|Analyst|Designer|Consultant|Specialist|Associate|Intern|Lead|Senior|Junior|Sr\.?|Jr\.?|Chief|Head|VP|Vice President|Coordinator|Administrator|Representative|Officer|Architect|Scientist|Drafter|Assistant|Fellow|Co-op|Researcher|Student Researcher|Research Assistant|Teaching Assistant)\\b',
-            re.I
-        )
-
         context_company = ""
         parsed = []
         
-        divs = exp_root.find_all("div", recursive=True)
-        
-        for div in divs:
-            lines = self._p_texts_clean(div)
+        for lines in self._iter_div_text_lines(exp_root):
             if not lines: continue
             
             has_date_range = any(utils.DATE_RANGE_RE.search(t) for t in lines)
-            has_duration = any(re.match(r'^\d+\s*(yr|yrs|mo|mos)', t, re.I) for t in lines)
+            has_duration = any(_DURATION_PREFIX_RE.match(t) for t in lines)
             
             # Company Header detection
             if has_duration and not has_date_range:
-                for t in lines:
-                    clean_t = t.strip()
-                    if not clean_t or junk_patterns.match(clean_t): continue
+                for clean_t in lines:
+                    if _FALLBACK_JUNK_LINE_RE.match(clean_t): continue
                     
                     ent_type, conf = classify_entity(clean_t)
                     if ent_type == "company" and conf >= 0.7:
@@ -2037,45 +2448,37 @@ class LinkedInScraper:
                 company = ""
                 title = ""
                 
-                classified_items = []
+                # One pass per part: classify, then let the title/company hint
+                # regexes override. Ranked by final confidence, ties broken by
+                # the classifier's own confidence, then by position.
+                candidates = []
                 for t in text_window:
                     clean_t = self._clean_context_line(t)
                     if not clean_t: continue
-                    
-                    parts = self._split_context_line(clean_t)
-                    
-                    for part in parts:
+
+                    for part in self._split_context_line(clean_t):
                         if is_location(part): continue
                         if is_university(part):
                             # Universities can be employers!
-                            classified_items.append((part, "company", 0.85))
+                            cat, conf = "company", 0.85
+                        else:
+                            cat, conf = classify_entity(part)
+                        if _FALLBACK_TITLE_HINT_RE.search(part):
+                            candidates.append((part, "job_title", 1.0, conf))
+                        elif _FALLBACK_COMPANY_HINT_RE.search(part):
+                            candidates.append((part, "company", 1.0, conf))
                         else:
-                            e_type, conf = classify_entity(part)
-                            classified_items.append((part, e_type, conf))
+                            candidates.append((part, cat, conf, conf))
 
-                classified_items.sort(key=lambda x: -x[2])
-                
-                final_candidates = []
-                for text, cat, conf in classified_items:
-                    if title_hints.search(text):
-                        final_candidates.append((text, "job_title", 1.0))
-                    elif company_hints.search(text):
-                        final_candidates.append((text, "company", 1.0))
-                    else:
-                        final_candidates.append((text, cat, conf))
-                
-                final_candidates.sort(key=lambda x: -x[2])
+                candidates.sort(key=lambda x: (-x[2], -x[3]))
 
-                for item_text, item_type, conf in final_candidates:
+                for item_text, item_type, _conf, _raw_conf in candidates:
                     if item_type == "company" and not company:
                         company = item_text
                     elif item_type == "job_title" and not title:
                         title = item_text
-                    elif item_type == "unknown":
-                        if not title and title_hints.search(item_text):
-                            title = item_text
-                        elif not company and company_hints.search(item_text):
-                            company = item_text
+                    if title and company:
+                        break
                             
                 # Context propagation
                 if title and not company and context_company:
@@ -2114,13 +2517,12 @@ class LinkedInScraper:
         return parsed[:max_entries]
 
     def _clean_context_line(self, t):
-        # Filtering helper
-        t = t.strip()
+        # Filtering helper; lines arrive stripped from _iter_div_text_lines.
         if not t: return None
-        if re.match(r'^(Full-time|Part-time|Contract|Internship)', t, re.I): return None
-        if t in ['·', '•', '·', '•']: return None
+        if _CONTEXT_EMPLOYMENT_PREFIX_RE.match(t): return None
+        if t in _BULLET_ONLY_LINES: return None
         # Remove suffix like "· Full-time" (including mojibake bullet variants)
-        return re.sub(r'\s*(?:·|•|·|•)\s*(Full-time|Part-time|Contract|Internship|Remote|Hybrid).*$', '', t, flags=re.I).strip()
+        return _CONTEXT_EMPLOYMENT_SUFFIX_RE.sub('', t).strip()
 
     def _split_context_line(self, text):
         potential_parts = []
@@ -2131,12 +2533,7 @@ class LinkedInScraper:
         # - " - " / " – " (dash/en-dash with spaces)
         # - "·" / "•" (dot/bullet)
         
-        # Regex for delimiters
-        # We require spaces around dashes to avoid splitting "Co-Founder" or "Tier-1"
-        # We allow flexible spacing for pipes and dots
-        delimiters = r'\s+(?:at|@)\s+|\s*\|\s*|\s*(?:-|\u2013|\u2014|–|—)\s*|\s*(?:·|•|·|•)\s*'
-        
-        parts = re.split(delimiters, text, flags=re.I)
+        parts = _CONTEXT_DELIMITER_RE.split(text)
         potential_parts = [p.strip() for p in parts if len(p.strip()) > 1] # Allowed >1 to catch "QA" or "HR"
         
         if not potential_parts:
@@ -2305,12 +2702,14 @@ class LinkedInScraper:
             return []
 
         entries = []
-        candidate_containers = (
-            edu_root.select("li.artdeco-list__item")
-            or edu_root.select("li.pvs-list__paged-list-item")
-            or edu_root.select("div[data-view-name='profile-component-entity']")
-            or edu_root.find_all("div")
-        )
+        candidate_containers = []
+        for selector in _ordered_edu_item_selectors():
+            candidate_containers = edu_root.select(selector)
+            if candidate_containers:
+                _edu_item_selector_hits[selector] += 1
+                break
+        if not candidate_containers:
+            candidate_containers = edu_root.find_all("div")
 
         for div in candidate_containers:
             lines = self._p_texts_clean(div)
@@ -2321,20 +2720,18 @@ class LinkedInScraper:
             # Instead of blindly using lines[0], look for /school/ links first
             # as the most reliable indicator of school name.
             school = ""
-            school_links = [
-                (a.get("href") or "").strip()
+            # One anchor pass; the href list and anchors are reused below.
+            school_anchors = [
+                ((a.get("href") or "").strip(), a)
                 for a in div.find_all("a", href=True)
                 if "/school/" in ((a.get("href") or "").lower())
             ]
-            unt_link_present = any(self._is_unt_school_href(href) for href in school_links)
+            unt_link_present = any(self._is_unt_school_href(href) for href, _ in school_anchors)
             if unt_link_present:
                 school = "University of North Texas"
-            elif school_links:
+            elif school_anchors:
                 # Extract school name from the anchor text
-                for anchor in div.find_all("a", href=True):
-                    href = (anchor.get("href") or "").strip()
-                    if "/school/" not in href.lower():
-                        continue
+                for _href, anchor in school_anchors:
                     school_text = anchor.get_text(" ", strip=True)
                     if school_text and len(school_text) > 2:
                         school = school_text
@@ -2342,16 +2739,16 @@ class LinkedInScraper:
             
             # Also try t-bold span (LinkedIn's pattern for primary text)
             if not school:
-                bold_elem = div.select_one('.t-bold span[aria-hidden="true"]') or div.select_one('.t-bold')
+                bold_elem = _BOLD_TEXT_SELECTOR.select_one(div) or _BOLD_SELECTOR.select_one(div)
                 if bold_elem:
-                    bold_text = bold_elem.get_text(strip=True).strip()
+                    bold_text = bold_elem.get_text(strip=True)
                     # Only use if it looks like a school name (not a date, not too short)
                     if bold_text and len(bold_text) > 2 and not utils.DATE_RANGE_RE.search(bold_text):
                         school = bold_text
             
             # Fallback: use first line
             if not school:
-                school = lines[0].strip()
+                school = lines[0]
             
             # Validate school name
             if not school or len(school) < 3:
@@ -2363,7 +2760,7 @@ class LinkedInScraper:
             
             # Check if line 1 is a date range (LinkedIn sometimes puts dates right after school)
             if len(lines) > 1:
-                potential_degree = lines[1].strip()
+                potential_degree = lines[1]
                 
                 # Check if it looks like a date range (e.g., "2022 - 2026" or "Jan 2022 - Present")
                 if utils.DATE_RANGE_RE.search(potential_degree) or utils.YEAR_RANGE_RE.search(potential_degree):
@@ -2375,7 +2772,7 @@ class LinkedInScraper:
                             grad_year = str(e_d.get("year"))
                     else:
                         # Fallback: extract years directly
-                        years = re.findall(r"\d{4}", potential_degree)
+                        years = _FOUR_DIGIT_YEAR_RE.findall(potential_degree)
                         if years:
                             grad_year = years[-1]  # Last year is graduation
                 else:
@@ -2397,13 +2794,13 @@ class LinkedInScraper:
                     
                 # Fallback year finder
                 if not grad_year and utils.YEAR_RANGE_RE.search(t):
-                    years = re.findall(r"\d{4}", t)
+                    years = _FOUR_DIGIT_YEAR_RE.findall(t)
                     if years:
                         grad_year = years[-1]
 
             # Heuristic check for validity
-            school_hint = unt_link_present or bool(re.search(r"(university|college|institute|school)", school, re.I))
-            degree_hint = bool(degree and re.search(r"(degree|bachelor|master|phd|mba|\bbs\b|\bba\b)", degree, re.I))
+            school_hint = unt_link_present or bool(_SCHOOL_HINT_RE.search(school))
+            degree_hint = bool(degree and _DEGREE_HINT_RE.search(degree))
             
             if not (school_hint or degree_hint):
                 continue
@@ -2440,17 +2837,8 @@ class LinkedInScraper:
             if not self._is_unt_school_name(school_name):
                 continue
             
-            score = 0
-            deg = (e.get("degree") or "").lower()
-            
-            # Score based on degree level
-            for k, val in utils.DEGREE_LEVELS.items():
-                if k in deg:
-                    score = val
-                    break
-            
-            # Bonus for Engineering
-            if any(k in deg for k in utils.ENGINEERING_KEYWORDS): score += 100
+            # Degree level plus engineering bonus
+            score = utils.degree_score(e.get("degree") or "")
             
             # Bonus for recent year
             yr = e.get("graduation_year")
@@ -2532,39 +2920,52 @@ class LinkedInScraper:
         
         return self._sort_education_entries(unique_entries)
 
-    def scrape_all_education(self, profile_url):
+    def scrape_all_education(self, profile_url, soup=None):
         """
         Open LinkedIn's "Show all education" page and scrape extra education records.
         This is only used when the main profile card cannot confidently identify UNT.
+        Pass the already-parsed profile ``soup``; without it the link is looked up
+        in the live DOM instead of parsing the whole page source.
         """
         all_edus = []
         unique_edus = []
         unt_details = None
+        detail_page = None
         
         try:
-            soup = BeautifulSoup(self.driver.page_source, "html.parser")
-            link = self._find_show_all_education_link(soup)
+            if soup is None:
+                link = self._find_show_all_education_link_live()
+            else:
+                link = self._find_show_all_education_link(soup)
             
             if not link:
                 logger.debug("No 'Show all education' link found.")
                 return [], None
 
-            logger.debug("Found 'Show all education' link. Clicking...")
-            if not link.startswith("http"): link = "https://www.linkedin.com" + link
-            self.driver.get(link)
-            time.sleep(3)
-            
-            detail_soup = BeautifulSoup(self.driver.page_source, "html.parser")
-            entries = []
-            if is_groq_available():
-                groq_results, _edu_tokens = extract_education_with_groq(
-                    str(detail_soup.find("main") or detail_soup),
-                    profile_name="unknown",
-                )
-                if groq_results:
-                    entries = self._build_education_entries_from_groq(groq_results)
+            # Ask the Voyager API for the education list from inside the current
+            # session first; that avoids loading the details page and the
+            # profile again just to read a few schools.
+            voyager_results = self._fetch_educations_via_voyager(profile_url)
+            if voyager_results:
+                logger.debug("Read education collection from the Voyager API.")
+                entries = self._build_education_entries_from_groq(voyager_results)
             else:
-                entries = self._extract_education_entries(detail_soup)
+                logger.debug("Found 'Show all education' link. Clicking...")
+                if not link.startswith("http"): link = "https://www.linkedin.com" + link
+                detail_page = self._open_detail_page(link)
+                self._wait_for_page_ready(_EDU_DETAIL_READY_CSS, timeout=10)
+
+                detail_soup = BeautifulSoup(self.driver.page_source, _HTML_PARSER)
+                entries = []
+                if is_groq_available():
+                    groq_results, _edu_tokens = extract_education_with_groq(
+                        str(detail_soup.find("main") or detail_soup),
+                        profile_name="unknown",
+                    )
+                    if groq_results:
+                        entries = self._build_education_entries_from_groq(groq_results)
+                else:
+                    entries = self._extract_education_entries(detail_soup)
 
             entries = self._sort_education_entries(entries)
             all_edus = list(dict.fromkeys([e.get("school", "") for e in entries if e.get("school")]))
@@ -2588,18 +2989,122 @@ class LinkedInScraper:
             else:
                 logger.info("      ❌ Still no UNT education found in detailed view.")
 
-            # Go back
-            self.driver.get(profile_url)
-            time.sleep(2)
-
         except Exception as e:
             logger.error(f"Error expanding education: {e}")
+        finally:
+            if detail_page is not None:
+                self._close_detail_page(detail_page, profile_url)
         
         return unique_edus, unt_details
 
+    def _fetch_educations_via_voyager(self, profile_url):
+        """
+        Fetch the education collection of ``profile_url`` through LinkedIn's
+        Voyager API using the session cookies already in the browser.
+
+        The profile is addressed by the ``/in/<slug>`` of ``profile_url`` rather
+        than any URN found in the page, which also embeds the viewer's and
+        "People also viewed" profiles. A response naming a different profile is
+        discarded so the caller falls back to the details page.
+        Returns entries shaped like Groq education results, or None on any failure.
+        """
+        match = _PROFILE_SLUG_RE.search(profile_url or "")
+        if not match:
+            return None
+        public_id = urllib.parse.unquote(match.group(1)).strip()
+        if not public_id:
+            return None
+        try:
+            raw = self.driver.execute_async_script("""
+                const publicId = arguments[0];
+                const done = arguments[arguments.length - 1];
+                const jsession = (document.cookie.match(/JSESSIONID="?([^";]+)/) || [])[1];
+                if (!jsession) { done(null); return; }
+                fetch('/voyager/api/identity/profiles/' + encodeURIComponent(publicId) + '/educations', {
+                    credentials: 'include',
+                    headers: {
+                        'csrf-token': jsession,
+                        'accept': 'application/vnd.linkedin.normalized+json+2.1',
+                    },
+                })
+                    .then((r) => (r.ok ? r.json() : null))
+                    .then(done, () => done(null));
+            """, public_id)
+        except Exception as e:
+            logger.debug(f"Voyager education fetch failed: {e}")
+            return None
+        if not isinstance(raw, dict):
+            return None
+
+        # Any profile object in the response must be the one being scraped.
+        for obj in [raw, *(raw.get("elements") or []), *(raw.get("included") or [])]:
+            if not isinstance(obj, dict):
+                continue
+            other_id = obj.get("publicIdentifier")
+            if other_id and str(other_id).lower() != public_id.lower():
+                logger.debug(
+                    "Voyager education response is for %s, not %s; ignoring it.",
+                    other_id,
+                    public_id,
+                )
+                return None
+
+        def _date_text(d):
+            if not isinstance(d, dict) or not d.get("year"):
+                return ""
+            month = d.get("month")
+            if month and 1 <= int(month) <= 12:
+                return f"{datetime(2000, int(month), 1):%b} {d['year']}"
+            return str(d["year"])
+
+        items = raw.get("elements") or raw.get("included") or []
+        results = []
+        for item in items:
+            if not isinstance(item, dict) or not item.get("schoolName"):
+                continue
+            period = item.get("timePeriod") or item.get("dateRange") or {}
+            end = period.get("endDate") or period.get("end")
+            results.append({
+                "school": item.get("schoolName", ""),
+                "degree_raw": item.get("degreeName", "") or "",
+                "major_raw": item.get("fieldOfStudy", "") or "",
+                "start_date": _date_text(period.get("startDate") or period.get("start")),
+                "end_date": _date_text(end),
+            })
+        return results or None
+
+    def _find_show_all_education_link_live(self):
+        """Same lookup as _find_show_all_education_link, run in one script round-trip."""
+        try:
+            # Both passes and the href reads happen in the page, rather than one
+            # driver command per find_elements / get_attribute call.
+            href = self.driver.execute_script("""
+                const hrefOf = (a) => ((a && a.href) || '').trim();
+                for (const a of document.querySelectorAll("a[href*='/details/education' i]")) {
+                    if (hrefOf(a)) return hrefOf(a);
+                }
+                for (const a of document.querySelectorAll('a[href]')) {
+                    const text = (a.textContent || '').replace(/\\s+/g, ' ').toLowerCase();
+                    if (text.includes('show all') && text.includes('education') && hrefOf(a)) {
+                        return hrefOf(a);
+                    }
+                }
+                return null;
+            """)
+            if href:
+                return href
+        except Exception as e:
+            logger.debug(f"Live 'Show all education' lookup failed: {e}")
+        return None
+
     def _find_show_all_education_link(self, soup):
         if not soup:
             return None
+        # Most layouts link straight to /details/education; match that with one
+        # compiled selector before paying for get_text() on every anchor.
+        link = _EDU_DETAILS_LINK_SELECTOR.select_one(soup)
+        if link is not None and (link.get("href") or "").strip():
+            return link.get("href").strip()
         for a in soup.find_all("a"):
             href = (a.get("href") or "").strip()
             if not href:
@@ -2622,12 +3127,13 @@ class LinkedInScraper:
         if not link.startswith("http"):
             link = "https://www.linkedin.com" + link
 
+        detail_page = None
         try:
             logger.debug("Found detailed education link; extracting from expanded page.")
-            self.driver.get(link)
-            time.sleep(2)
+            detail_page = self._open_detail_page(link)
+            self._wait_for_page_ready(_EDU_DETAIL_READY_CSS, timeout=10)
 
-            detail_soup = BeautifulSoup(self.driver.page_source, "html.parser")
+            detail_soup = BeautifulSoup(self.driver.page_source, _HTML_PARSER)
             main = detail_soup.find("main") or detail_soup
 
             entries = []
@@ -2675,15 +3181,72 @@ class LinkedInScraper:
             logger.debug(f"Detailed education extraction failed: {e}")
             return [], token_count
         finally:
+            if detail_page is not None:
+                self._close_detail_page(detail_page, profile_url)
+
+    def _open_detail_page(self, link):
+        """
+        Load a profile sub-page in a new tab so the profile tab stays as it is.
+        Returns the profile tab handle, or "" when the page had to be loaded in place.
+        """
+        try:
+            profile_handle = self.driver.current_window_handle
+            self.driver.switch_to.new_window("tab")
+        except Exception as e:
+            logger.debug(f"Could not open a detail tab, navigating in place: {e}")
+            profile_handle = ""
+        try:
+            self.driver.get(link)
+        except Exception:
+            # The caller never receives the handle, so close the stray tab here.
+            if profile_handle:
+                try:
+                    self.driver.close()
+                    self.driver.switch_to.window(profile_handle)
+                except Exception as close_err:
+                    logger.debug(f"Could not close the failed detail tab: {close_err}")
+            raise
+        return profile_handle
+
+    def _close_detail_page(self, profile_handle, profile_url):
+        """Close the detail tab and return to the profile; reload it only if we navigated away."""
+        if profile_handle:
             try:
-                self.driver.get(profile_url)
-                time.sleep(1)
-            except Exception:
-                pass
+                self.driver.close()
+                self.driver.switch_to.window(profile_handle)
+                return
+            except Exception as e:
+                logger.debug(f"Could not return to the profile tab: {e}")
+                try:
+                    self.driver.switch_to.window(self.driver.window_handles[0])
+                except Exception:
+                    pass
+        try:
+            self.driver.get(profile_url)
+            self._wait_for_page_ready()
+        except Exception:
+            pass
 
     # ============================================================
     # Parsing Helpers
     # ============================================================
+    def _section_headings(self, soup):
+        """``(tag, lowered text)`` for every <h2>, then every <h3>, in ``soup``.
+
+        The page soup is not mutated during parsing, so the scan is done once
+        per soup and reused for each section lookup on it.
+        """
+        cached = self._section_headings_cache
+        if cached is not None and cached[0] is soup:
+            return cached[1]
+        headings = [
+            (h, h.get_text(" ", strip=True).lower())
+            for tag in ("h2", "h3")
+            for h in soup.find_all(tag)
+        ]
+        self._section_headings_cache = (soup, headings)
+        return headings
+
     def _find_section_root(self, soup, heading_text):
         """
         Resolve a section container by heading text.
@@ -2692,37 +3255,30 @@ class LinkedInScraper:
         norm = heading_text.lower()
         
         # Try h2, h3 tags
-        for tag in ("h2", "h3"):
-            for h in soup.find_all(tag):
-                text = h.get_text(" ", strip=True).lower()
-                # Changed to partial match to handle LinkedIn's <!---->Education<!----> structure
-                if norm in text:
-                    return h.find_parent("section") or h.find_parent("div")
+        for h, text in self._section_headings(soup):
+            # Changed to partial match to handle LinkedIn's <!---->Education<!----> structure
+            if norm in text:
+                return h.find_parent("section") or h.find_parent("div")
         
-        # Also try span with aria-hidden (LinkedIn's current pattern)
-        for span in soup.find_all("span", {"aria-hidden": "true"}):
-            text = span.get_text(" ", strip=True).lower()
-            if text == norm:
-                # Walk up to find section or card
-                parent = span.find_parent("section")
-                if parent:
-                    return parent
-
-        component_markers = (
-            f"{norm}toplevelsection",
-            f"profile_{norm}_top_anchor",
-            f"/details/{norm}",
-        )
-        for tag in soup.find_all(["section", "div"]):
-            haystack = " ".join(
-                str(tag.get(attr, "") or "")
-                for attr in ("componentkey", "id", "data-view-name", "aria-label")
-            ).lower()
-            if any(marker in haystack for marker in component_markers):
-                return tag
+        # Also try span with aria-hidden (LinkedIn's current pattern). Match the
+        # heading text nodes directly rather than calling get_text() on every
+        # aria-hidden span in the page; only the hits are checked against the span.
+        for text_node in soup.find_all(string=_heading_text_re(norm)):
+            span = text_node.find_parent("span", attrs={"aria-hidden": "true"})
+            if span is None or span.get_text(" ", strip=True).lower() != norm:
+                continue
+            # Walk up to find section or card
+            parent = span.find_parent("section")
+            if parent:
+                return parent
+
+        # Compiled attribute selectors replace a per-tag Python attribute join.
+        marker_tag = _section_marker_selector(norm).select_one(soup)
+        if marker_tag is not None:
+            return marker_tag
 
         if norm == "education":
-            school_link = soup.find("a", href=lambda href: href and "/school/" in href.lower())
+            school_link = _SCHOOL_LINK_SELECTOR.select_one(soup)
             if school_link:
                 return school_link.find_parent("section") or school_link.find_parent("div")
         
@@ -2739,18 +3295,75 @@ class LinkedInScraper:
         import copy
         work = copy.copy(container)
         # Remove "visually hidden" or skill descriptions
-        for bad in work.select("[data-testid='expandable-text-box'], .visually-hidden"):
+        for bad in _P_TEXT_HIDDEN_SELECTOR.select(work):
             bad.decompose()
         
         lines = []
+        seen = set()
         for p in work.find_all(["p", "span"]):
             # Specific exclusion for skill badges
-            if p.select_one("svg"): continue
+            if p.find("svg") is not None: continue
             t = p.get_text(" ", strip=True)
-            if t and t not in lines:
+            if t and t not in seen:
+                seen.add(t)
                 lines.append(t)
         return lines
 
+    def _iter_div_text_lines(self, root):
+        """Yield ``_p_texts_clean(div)`` for every <div> under ``root``, in document order.
+
+        Nested divs share most of their <p>/<span> descendants, so each element's
+        text is computed once instead of a subtree copy plus a get_text() pass
+        per div. ``_p_texts_clean`` only drops hidden elements *below* the div it
+        cleans, so an element is skipped for a div exactly when its nearest
+        hidden ancestor-or-self sits deeper than that div.
+        """
+        if not root:
+            return
+        hidden = {id(tag) for tag in _P_TEXT_HIDDEN_SELECTOR.select(root)}
+        # Per element: tree depth, depth of its nearest hidden ancestor-or-self
+        # (-1 if none below root), and whether a hidden element sits inside it.
+        depth = {id(root): 0}
+        hidden_depth = {id(root): -1}
+        contains_hidden = set()
+        for tag in root.find_all(True):
+            parent_id = id(tag.parent)
+            tag_depth = depth[parent_id] + 1
+            depth[id(tag)] = tag_depth
+            if id(tag) in hidden:
+                hidden_depth[id(tag)] = tag_depth
+                for ancestor in tag.parents:
+                    if ancestor is root or id(ancestor) in contains_hidden:
+                        break
+                    contains_hidden.add(id(ancestor))
+            else:
+                hidden_depth[id(tag)] = hidden_depth[parent_id]
+
+        text_cache = {}
+        for div in root.find_all("div"):
+            div_depth = depth[id(div)]
+            lines = []
+            seen = set()
+            for p in div.find_all(["p", "span"]):
+                if hidden_depth[id(p)] > div_depth:
+                    continue
+                t = text_cache.get(id(p))
+                if t is None:
+                    work = p
+                    if id(p) in contains_hidden:
+                        # Hidden descendants are always below the div; read the
+                        # text from a copy without them.
+                        work = copy.copy(p)
+                        for bad in _P_TEXT_HIDDEN_SELECTOR.select(work):
+                            bad.decompose()
+                    # Specific exclusion for skill badges
+                    t = "" if work.find("svg") is not None else work.get_text(" ", strip=True)
+                    text_cache[id(p)] = t
+                if t and t not in seen:
+                    seen.add(t)
+                    lines.append(t)
+            yield lines
+
     def _clean_company(self, text):
         """Remove employment type and location suffixes from company text.
         
@@ -2761,7 +3374,7 @@ class LinkedInScraper:
         """
         if not text: return ""
         # First strip employment type and everything after it
-        cleaned = re.sub(r"\s*·\s*(Full-time|Part-time|Contract|Internship|Remote|Hybrid|On-site|Self-employed|Freelance|Seasonal|Temporary|Apprenticeship).*$", "", text, flags=re.I).strip()
+        cleaned = _COMPANY_EMPLOYMENT_SUFFIX_RE.sub("", text).strip()
         # Then check if remaining text still has a · separator with a location fragment
         # e.g., "Company · Dallas" → strip the location part
         if "·" in cleaned:
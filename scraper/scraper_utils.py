@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from datetime import timedelta, datetime, date
 from calendar import monthrange
 import pandas as pd
@@ -34,29 +35,58 @@ ENGINEERING_KEYWORDS = (
     'data science', 'cybersecurity', 'information technology',
     'electronics', 'robotics', 'mechatronics', 'energy',
 )
+_ENGINEERING_KEYWORDS_RE = re.compile('|'.join(re.escape(k) for k in ENGINEERING_KEYWORDS))
+
+EMPLOYMENT_TYPE_TOKENS = frozenset({
+    "Full-time", "Part-time", "Internship", "Contract", "Temporary",
+    "Volunteer", "Apprenticeship", "Self-employed", "Freelance",
+    "Remote", "Hybrid", "On-site"
+})
+# Only "· BadWord" patterns (LinkedIn suffix style), all types in one pass.
+_EMPLOYMENT_SUFFIX_RE = re.compile(
+    r'\s*·\s*(?:' + '|'.join(re.escape(t) for t in sorted(EMPLOYMENT_TYPE_TOKENS)) + r')\b',
+    re.IGNORECASE,
+)
+
+@lru_cache(maxsize=1024)
+def degree_score(degree_text: str) -> int:
+    """Rank a degree string: level from DEGREE_LEVELS plus 100 for engineering fields.
 
+    Cached because the same degree strings repeat across profiles.
+    """
+    deg = (degree_text or "").lower()
+    score = 0
+    for k, val in DEGREE_LEVELS.items():
+        if k in deg:
+            score = val
+            break
+    if _ENGINEERING_KEYWORDS_RE.search(deg):
+        score += 100
+    return score
+
+@lru_cache(maxsize=4096)
 def clean_job_title(raw_title: str) -> str:
+    # Titles repeat heavily across profiles ("Software Engineer", "Student"),
+    # so results are memoized; the function is pure.
     if not raw_title:
         return ""
-    raw = " ".join(raw_title.strip().split())
+    # split() already drops leading/trailing whitespace.
+    raw = " ".join(raw_title.split())
     
     # Only filter if the ENTIRE string is just an employment type
-    banned_exact = {
-        "Full-time", "Part-time", "Internship", "Contract", "Temporary",
-        "Volunteer", "Apprenticeship", "Self-employed", "Freelance",
-        "Remote", "Hybrid", "On-site"
-    }
-    if raw in banned_exact:
+    if raw in EMPLOYMENT_TYPE_TOKENS:
         return ""
     
     # Remove employment type suffixes (e.g., "· Full-time", "· Internship")
     # But DON'T remove if it's part of a compound title like "Summer Internship"
-    for bad in banned_exact:
-        # Only remove "· BadWord" patterns (LinkedIn suffix style)
-        raw = re.sub(rf'\s*·\s*{bad}\b', '', raw, flags=re.I)
+    # Every suffix starts with the "·" separator, so most titles skip the regex.
+    if "·" not in raw:
+        return raw
+    raw = _EMPLOYMENT_SUFFIX_RE.sub('', raw)
     
-    return " ".join(raw.split()).strip()
+    return " ".join(raw.split())
 
+@lru_cache(maxsize=32)
 def parse_frequency(frequency_str: str) -> timedelta:
     try:
         parts = frequency_str.strip().lower().split()
@@ -71,25 +101,25 @@ def parse_frequency(frequency_str: str) -> timedelta:
     except Exception:
         return timedelta(days=180)
 
+_NAME_INPUT_COLUMNS = frozenset({"name", "first_name", "last_name"})
+
+
 def load_names_from_csv(csv_path: Path):
     try:
-        df = pd.read_csv(csv_path)
+        # Only the name columns are parsed; the rest of the export is skipped.
+        df = pd.read_csv(
+            csv_path,
+            dtype=str,
+            keep_default_na=False,
+            usecols=lambda col: col in _NAME_INPUT_COLUMNS,
+        )
         if 'name' in df.columns:
-            return [str(n).strip() for n in df['name'].dropna().unique() if str(n).strip()]
-        if 'first_name' in df.columns and 'last_name' in df.columns:
-            names = [
-                f"{str(r).strip()} {str(l).strip()}".strip()
-                for r, l in zip(df['first_name'].fillna(''), df['last_name'].fillna(''))
-                if (str(r).strip() or str(l).strip())
-            ]
-            seen = set()
-            uniq = []
-            for n in names:
-                if n not in seen:
-                    seen.add(n)
-                    uniq.append(n)
-            return uniq
-        raise ValueError("Input CSV must contain either 'name' or ('first_name','last_name').")
+            names = df['name'].str.strip()
+        elif 'first_name' in df.columns and 'last_name' in df.columns:
+            names = (df['first_name'].str.strip() + " " + df['last_name'].str.strip()).str.strip()
+        else:
+            raise ValueError("Input CSV must contain either 'name' or ('first_name','last_name').")
+        return [n for n in dict.fromkeys(names) if n]
     except Exception as e:
         logger.error(f"Failed to read names from {csv_path}: {e}")
         return []
@@ -289,6 +289,8 @@ if not LINKEDIN_EMAIL or not LINKEDIN_PASSWORD:
 
 HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"
 USE_COOKIES = os.getenv("USE_COOKIES", "false").lower() == "true"
+# Profile text is all we read; skipping images cuts bytes and render time per page.
+BLOCK_IMAGES = _env_bool("BLOCK_IMAGES", True)
 LINKEDIN_COOKIES_PATH = os.getenv("LINKEDIN_COOKIES_PATH", "linkedin_cookies.json")
 # App-level defaults are intentionally config-driven (not .env-driven) for teammate consistency.
 SCRAPER_MODE = (os.getenv("GUI_SCRAPER_MODE", "search") or "search").strip().lower()
@@ -46,3 +46,52 @@ def test_ensure_migrates_partial_schema(monkeypatch, tmp_path):
     assert df.iloc[0]["first"] == "Ali"
     jet = df.iloc[0]["job_employment_type"]
     assert jet == "" or (isinstance(jet, float) and pd.isna(jet))
+
+
+def test_save_profile_appends_new_rows_and_replaces_rescrapes(monkeypatch, tmp_path):
+    out = tmp_path / "UNT_Alumni_Data.csv"
+    monkeypatch.setattr(database_handler, "OUTPUT_CSV", out)
+    monkeypatch.setattr(database_handler, "flag_profile_for_review", lambda _data: None)
+    monkeypatch.setattr(database_handler, "_run_experience_analysis_on_profile", lambda _data: None)
+
+    def _profile(slug, title):
+        return {
+            "name": "Test Person",
+            "profile_url": f"https://www.linkedin.com/in/{slug}/",
+            "school": "University of North Texas",
+            "graduation_year": "2024",
+            "job_title": title,
+            "company": "ACME",
+        }
+
+    assert database_handler.save_profile_to_csv(_profile("first-person", "Engineer"))
+    assert database_handler.save_profile_to_csv(_profile("second-person", "Analyst"))
+    assert database_handler.save_profile_to_csv(_profile("first-person", "Senior Engineer"))
+
+    df = pd.read_csv(out, encoding="utf-8")
+    assert list(df.columns) == database_handler.CSV_COLUMNS
+    assert len(df) == 2
+    titles = dict(zip(df["linkedin_url"], df["title"]))
+    assert titles["https://www.linkedin.com/in/first-person"] == "Senior Engineer"
+    assert titles["https://www.linkedin.com/in/second-person"] == "Analyst"
+    assert set(df["grad_year"]) == {2024}
+
+
+def test_compact_alumni_output_csv_dedupes_and_normalizes(monkeypatch, tmp_path):
+    out = tmp_path / "UNT_Alumni_Data.csv"
+    monkeypatch.setattr(database_handler, "OUTPUT_CSV", out)
+    database_handler.ensure_alumni_output_csv()
+    rows = pd.DataFrame(
+        [
+            {"first": "Old", "linkedin_url": "https://www.linkedin.com/in/dup/", "grad_year": "2020.0"},
+            {"first": "Other", "linkedin_url": "https://www.linkedin.com/in/other", "grad_year": ""},
+            {"first": "New", "linkedin_url": "https://www.linkedin.com/in/dup", "grad_year": "2021"},
+        ]
+    ).reindex(columns=database_handler.CSV_COLUMNS)
+    rows.to_csv(out, index=False, encoding="utf-8")
+
+    database_handler.compact_alumni_output_csv()
+
+    df = pd.read_csv(out, encoding="utf-8")
+    assert list(df["first"]) == ["Other", "New"]
+    assert df.iloc[1]["grad_year"] == 2021
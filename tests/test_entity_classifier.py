@@ -154,6 +154,14 @@ class TestEntityClassifier:
         entity_type, _ = classify_entity("GOOGLE")
         assert entity_type == "company"
 
+    def test_classify_handles_bare_dash_or_slash_last_token_with_spacy_loaded(self, monkeypatch):
+        """A trailing " -" or " /" must not break the spaCy tier."""
+        monkeypatch.setattr(entity_classifier_module, "_nlp", lambda _text: SimpleNamespace(ents=[]))
+
+        assert self.classifier.classify("Acme Corp -") == ("company", 0.5)
+        assert self.classifier.classify("Dallas -") == ("unknown", 0.3)
+        assert self.classifier.classify("Acme Corp /") == ("company", 0.5)
+
     def test_get_nlp_nonblocking_skips_download_when_model_missing(self, monkeypatch):
         """Missing spaCy model should fall back immediately unless auto-download is enabled."""
         entity_classifier_module._nlp = None
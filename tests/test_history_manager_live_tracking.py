@@ -75,3 +75,84 @@ def test_history_manager_should_skip_uses_normalized_profile_url(monkeypatch, tm
         "https://www.linkedin.com/in/john-doe?miniProfileUrn=xyz",
     ]
     assert all(history.should_skip(url) for url in variants)
+
+
+def test_mark_as_visited_appends_rows_that_reload_latest_first(monkeypatch, tmp_path):
+    monkeypatch.setattr(database_handler, "save_visited_profile", lambda *_args, **_kwargs: True)
+    history = _build_history_manager(monkeypatch, tmp_path)
+    history.mark_as_visited("https://www.linkedin.com/in/jane-doe", saved=False)
+    history.mark_as_visited("https://www.linkedin.com/in/jane-doe", saved=True)
+    history.close()
+
+    reloaded = _build_history_manager(monkeypatch, tmp_path)
+    reloaded.load_from_csv()
+
+    assert reloaded.visited_history["https://www.linkedin.com/in/jane-doe"]["saved"] == "yes"
+
+
+def test_superseded_visit_rows_are_compacted_after_threshold(monkeypatch, tmp_path):
+    monkeypatch.setattr(database_handler, "save_visited_profile", lambda *_args, **_kwargs: True)
+    monkeypatch.setattr(database_handler.HistoryManager, "_COMPACT_EVERY", 2)
+    history = _build_history_manager(monkeypatch, tmp_path)
+    history.load_from_csv()
+    history.mark_as_visited("https://www.linkedin.com/in/jane-doe", saved=True)
+    history.mark_as_visited("https://www.linkedin.com/in/jane-doe", saved=False)
+    history.mark_as_visited("https://www.linkedin.com/in/jane-doe", saved=True)
+    history.close()
+
+    lines = (tmp_path / "visited_history.csv").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2  # header + one compacted row
+    assert lines[1].startswith("https://www.linkedin.com/in/jane-doe,yes,")
+
+
+def test_repeat_visit_with_same_outcome_skips_db_and_csv_writes(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(
+        database_handler,
+        "save_visited_profile",
+        lambda url, **_kwargs: calls.append(url) or True,
+    )
+    history = _build_history_manager(monkeypatch, tmp_path)
+
+    assert history.mark_as_visited("https://www.linkedin.com/in/jane-doe?trk=a", saved=True) is True
+    assert history.mark_as_visited("https://www.linkedin.com/in/jane-doe/", saved=True) is True
+    history.mark_as_visited("https://www.linkedin.com/in/jane-doe", saved=False)
+    history.close()
+
+    assert calls == ["https://www.linkedin.com/in/jane-doe"] * 2
+    lines = (tmp_path / "visited_history.csv").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 3
+
+
+def test_sync_with_db_parses_string_last_checked_timestamps(monkeypatch, tmp_path):
+    monkeypatch.setattr(database_handler, "UPDATE_FREQUENCY", "30 days")
+    monkeypatch.setattr(
+        database_handler,
+        "get_all_visited_profiles",
+        lambda: [
+            {"linkedin_url": "https://www.linkedin.com/in/old", "is_unt_alum": 1,
+             "visited_at": "2020-01-01", "last_checked": "2020-01-01T00:00:00Z", "needs_update": 0},
+            {"linkedin_url": "https://www.linkedin.com/in/fresh", "is_unt_alum": 1,
+             "visited_at": "2020-01-01", "last_checked": "2999-01-01 00:00:00", "needs_update": 0},
+            {"linkedin_url": "https://www.linkedin.com/in/garbled", "is_unt_alum": 1,
+             "visited_at": "2020-01-01", "last_checked": "not a date", "needs_update": 0},
+        ],
+    )
+    history = _build_history_manager(monkeypatch, tmp_path)
+    history.sync_with_db()
+
+    assert history.visited_history["https://www.linkedin.com/in/old"]["update_needed"] == "yes"
+    assert history.visited_history["https://www.linkedin.com/in/fresh"]["update_needed"] == "no"
+    assert history.visited_history["https://www.linkedin.com/in/garbled"]["update_needed"] == "no"
+
+
+def test_mark_as_visited_row_is_on_disk_before_close(monkeypatch, tmp_path):
+    monkeypatch.setattr(database_handler, "save_visited_profile", lambda *_args, **_kwargs: True)
+    history = _build_history_manager(monkeypatch, tmp_path)
+    history.mark_as_visited("https://www.linkedin.com/in/jane-doe", saved=True)
+
+    # No close()/atexit: a killed run must not lose the visit.
+    lines = (tmp_path / "visited_history.csv").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert lines[1].startswith("https://www.linkedin.com/in/jane-doe,yes,")
+    history.close()
@@ -2,6 +2,7 @@
 import sys
 import os
 import json
+import time
 import pytest
 from pathlib import Path
 from bs4 import BeautifulSoup
@@ -190,6 +191,27 @@ class TestScraperLogic:
         assert root is not None
         assert "EducationTopLevelSection".lower() in str(root.get("componentkey", "")).lower()
 
+    def test_iter_div_text_lines_matches_per_div_cleaning_for_hidden_divs(self):
+        scraper = LinkedInScraper()
+        soup = BeautifulSoup(
+            """
+            <section>
+              <div>
+                <div class="visually-hidden"><span>Acme Corp</span><span class="visually-hidden">x</span></div>
+                <span>Software Engineer</span>
+              </div>
+            </section>
+            """,
+            "html.parser",
+        )
+        root = soup.section
+
+        lines = list(scraper._iter_div_text_lines(root))
+
+        # A hidden div is only dropped from its ancestors' lines, not its own.
+        assert lines == [["Software Engineer"], ["Acme Corp"]]
+        assert lines == [scraper._p_texts_clean(div) for div in root.find_all("div")]
+
     def test_scrape_profile_page_merges_inline_unt_education_when_detailed_view_is_partial(self, monkeypatch):
         profile_url = "https://www.linkedin.com/in/test-user"
         scraper = LinkedInScraper()
@@ -209,7 +231,12 @@ class TestScraperLogic:
                     return self._html
                 return None
 
-        scraper.driver = _FakeDriver("<main></main>", profile_url)
+        scraper.driver = _FakeDriver(
+            "<main><section><h2>Education</h2>"
+            "<a href='https://www.linkedin.com/school/6464/'>University of North Texas</a>"
+            "</section></main>",
+            profile_url,
+        )
         monkeypatch.setattr(scraper, "_force_focus", lambda: None)
         monkeypatch.setattr(scraper, "_page_block_reason", lambda: None)
         monkeypatch.setattr(scraper, "_page_not_found", lambda: False)
@@ -259,6 +286,70 @@ class TestScraperLogic:
         assert result["school"] == "University of North Texas"
         assert result["education"] == "University of North Texas"
 
+    def test_scrape_profile_page_drops_section_headings_cache_after_profile(self, monkeypatch):
+        scraper = LinkedInScraper()
+        soup = BeautifulSoup("<section><h2>Education</h2></section>", "html.parser")
+
+        def _fake_scrape(_url):
+            assert scraper._find_section_root(soup, "Education") is soup.section
+            assert scraper._section_headings_cache is not None
+            return {"name": "Test User"}
+
+        monkeypatch.setattr(scraper, "_scrape_profile_page", _fake_scrape)
+
+        scraper.scrape_profile_page("https://www.linkedin.com/in/test-user")
+
+        assert scraper._section_headings_cache is None
+
+    def test_scrape_profile_page_waits_out_groq_prefetch_when_scrape_fails(self, monkeypatch):
+        profile_url = "https://www.linkedin.com/in/test-user"
+        scraper = LinkedInScraper()
+        assert scraper._groq_prefetch_pool is None
+        finished = []
+
+        class _FakeDriver:
+            current_url = profile_url
+            title = "Test User | LinkedIn"
+
+            def get(self, url):
+                pass
+
+            def quit(self):
+                pass
+
+            def execute_script(self, script, *_args):
+                if "return document.body.innerHTML;" in script:
+                    return (
+                        "<main><section><h2>Education</h2>"
+                        "<span>University of North Texas</span></section></main>"
+                    )
+                return None
+
+        def _slow_groq(*_args, **_kwargs):
+            time.sleep(0.05)
+            finished.append(True)
+            return [], 0
+
+        def _boom(*_args, **_kwargs):
+            raise RuntimeError("experience extraction failed")
+
+        scraper.driver = _FakeDriver()
+        monkeypatch.setattr(scraper, "_force_focus", lambda: None)
+        monkeypatch.setattr(scraper, "_wait_for_page_ready", lambda *_args, **_kwargs: True)
+        monkeypatch.setattr(scraper, "_page_block_reason", lambda: None)
+        monkeypatch.setattr(scraper, "_page_not_found", lambda: False)
+        monkeypatch.setattr(scraper, "scroll_full_page", lambda: None)
+        monkeypatch.setattr(scraper, "_wait_for_top_card", lambda timeout=10: True)
+        monkeypatch.setattr(scraper, "_wait_for_education_ready", lambda timeout=10: True)
+        monkeypatch.setattr(scraper, "_extract_top_card", lambda _soup: ("Test User", "", "Denton, Texas"))
+        monkeypatch.setattr(scraper, "_extract_all_experiences", _boom)
+        monkeypatch.setattr(scraper_module, "is_groq_available", lambda: True)
+        monkeypatch.setattr(scraper_module, "extract_education_with_groq", _slow_groq)
+
+        assert scraper._scrape_profile_page(profile_url) is None
+        assert finished == [True]
+        scraper.quit()
+
     def test_scroll_full_page_moves_down_then_back_up(self, monkeypatch):
         scraper = LinkedInScraper()
         deltas = []
@@ -319,6 +410,40 @@ class TestScraperLogic:
         assert result["__status__"] == "NOT_UNT_ALUM"
         assert scroll_calls == ["scroll"]
 
+    def test_scrape_profile_page_skips_extraction_when_page_never_mentions_unt(self, monkeypatch):
+        profile_url = "https://www.linkedin.com/in/test-user"
+        scraper = LinkedInScraper()
+
+        class _FakeDriver:
+            current_url = profile_url
+            title = "Test User | LinkedIn"
+
+            def get(self, url):
+                self.current_url = url
+
+            def execute_script(self, script, *_args):
+                if "return document.body.innerHTML;" in script:
+                    return "<main><section><h2>Education</h2><p>Texas A&amp;M University</p></section></main>"
+                return None
+
+        def _unexpected(*_args, **_kwargs):
+            raise AssertionError("experience extraction should be skipped")
+
+        scraper.driver = _FakeDriver()
+        monkeypatch.setattr(scraper, "_force_focus", lambda: None)
+        monkeypatch.setattr(scraper, "_page_block_reason", lambda: None)
+        monkeypatch.setattr(scraper, "_page_not_found", lambda: False)
+        monkeypatch.setattr(scraper, "scroll_full_page", lambda: None)
+        monkeypatch.setattr(scraper, "_wait_for_top_card", lambda timeout=10: True)
+        monkeypatch.setattr(scraper, "_wait_for_education_ready", lambda timeout=10: True)
+        monkeypatch.setattr(scraper, "_extract_top_card", lambda _soup: ("Test User", "", "Austin, Texas"))
+        monkeypatch.setattr(scraper, "_extract_all_experiences", _unexpected)
+
+        result = scraper.scrape_profile_page(profile_url)
+
+        assert result["__status__"] == "NOT_UNT_ALUM"
+        assert result["name"] == "Test User"
+
     def test_extract_all_experiences_falls_back_to_css_when_groq_returns_empty(self, monkeypatch):
         scraper = LinkedInScraper()
         soup = BeautifulSoup(
@@ -511,5 +636,107 @@ class TestScraperLogic:
 
         assert location == "Charlotte Metro"
 
+    def test_fetch_educations_via_voyager_addresses_profile_by_url_slug(self):
+        scraper = LinkedInScraper()
+        calls = []
+
+        class _FakeDriver:
+            def execute_async_script(self, script, *args):
+                calls.append(args)
+                return {
+                    "included": [
+                        {"publicIdentifier": "test-user"},
+                        {
+                            "schoolName": "University of North Texas",
+                            "degreeName": "Bachelor of Science",
+                            "fieldOfStudy": "Computer Science",
+                            "timePeriod": {"startDate": {"year": 2021, "month": 8}},
+                        },
+                    ],
+                }
+
+        scraper.driver = _FakeDriver()
+
+        results = scraper._fetch_educations_via_voyager("https://www.linkedin.com/in/test-user/?trk=abc")
+
+        assert calls == [("test-user",)]
+        assert results == [{
+            "school": "University of North Texas",
+            "degree_raw": "Bachelor of Science",
+            "major_raw": "Computer Science",
+            "start_date": "Aug 2021",
+            "end_date": "",
+        }]
+
+    def test_scrape_all_education_falls_back_when_voyager_returns_another_profile(self, monkeypatch):
+        scraper = LinkedInScraper()
+        opened = []
+
+        class _FakeDriver:
+            page_source = "<main></main>"
+
+            def execute_async_script(self, script, *args):
+                return {
+                    "included": [
+                        {"publicIdentifier": "someone-else"},
+                        {"schoolName": "Other State University"},
+                    ],
+                }
+
+        scraper.driver = _FakeDriver()
+        monkeypatch.setattr(scraper, "_find_show_all_education_link", lambda _soup: "/in/test-user/details/education/")
+        monkeypatch.setattr(scraper, "_open_detail_page", lambda link: opened.append(link) or "")
+        monkeypatch.setattr(scraper, "_close_detail_page", lambda *_args: None)
+        monkeypatch.setattr(scraper, "_wait_for_page_ready", lambda *_args, **_kwargs: True)
+        monkeypatch.setattr(scraper_module, "is_groq_available", lambda: False)
+        monkeypatch.setattr(
+            scraper,
+            "_extract_education_entries",
+            lambda _soup: [{
+                "school": "University of North Texas",
+                "degree": "Bachelor of Science",
+                "major": "Computer Science",
+                "graduation_year": "2024",
+                "school_start": None,
+                "school_end": None,
+            }],
+        )
+
+        schools, _unt_details = scraper.scrape_all_education(
+            "https://www.linkedin.com/in/test-user",
+            soup=BeautifulSoup("<main></main>", "html.parser"),
+        )
+
+        assert opened == ["https://www.linkedin.com/in/test-user/details/education/"]
+        assert schools == ["University of North Texas"]
+
+    def test_open_detail_page_closes_new_tab_when_navigation_fails(self):
+        scraper = LinkedInScraper()
+        events = []
+
+        class _SwitchTo:
+            def new_window(self, kind):
+                events.append(("new_window", kind))
+
+            def window(self, handle):
+                events.append(("window", handle))
+
+        class _FakeDriver:
+            current_window_handle = "profile-tab"
+            switch_to = _SwitchTo()
+
+            def get(self, url):
+                raise RuntimeError("navigation timed out")
+
+            def close(self):
+                events.append(("close",))
+
+        scraper.driver = _FakeDriver()
+
+        with pytest.raises(RuntimeError):
+            scraper._open_detail_page("https://www.linkedin.com/in/test-user/details/education/")
+
+        assert events == [("new_window", "tab"), ("close",), ("window", "profile-tab")]
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -100,6 +100,32 @@ def test_run_names_mode_default_input_csv(monkeypatch):
     assert captured["csv_path"].name == "engineering_graduates.csv"
 
 
+def test_run_names_mode_finishes_background_saves_before_returning(monkeypatch):
+    saved = []
+
+    class _ProfileScraper(_DummyScraper):
+        def extract_profile_urls_from_page(self):
+            return ["https://www.linkedin.com/in/jane-doe", "https://www.linkedin.com/in/john-doe"]
+
+        def scrape_profile_page(self, url):
+            return {"name": url.rsplit("/", 1)[-1], "profile_url": url}
+
+    def _fake_save(data, input_url, _history_mgr):
+        saved.append(input_url)
+        return True
+
+    monkeypatch.setattr(scraper_main.utils, "load_names_from_csv", lambda _path: ["Jane Doe"])
+    monkeypatch.setattr(scraper_main.time, "sleep", lambda _s: None)
+    monkeypatch.setattr(scraper_main, "wait_between_profiles", lambda: None)
+    monkeypatch.setattr(scraper_main, "_save_and_track", _fake_save)
+    scraper_main.exit_requested = False
+    scraper_main.force_exit = False
+
+    scraper_main.run_names_mode(_ProfileScraper(), _DummyNav(ok=True), _DummyHistory())
+
+    assert saved == ["https://www.linkedin.com/in/jane-doe", "https://www.linkedin.com/in/john-doe"]
+
+
 def test_is_blocked_url_rejects_test_placeholders():
     assert scraper_main.config.is_blocked_url("https://www.linkedin.com/in/test")
     assert scraper_main.config.is_blocked_url("https://www.linkedin.com/in/test-user")
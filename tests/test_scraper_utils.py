@@ -37,3 +37,11 @@ def test_clean_doubled():
     assert _clean_doubled("Normal") == "Normal"
     assert _clean_doubled("") == ""
     assert _clean_doubled(None) is None
+
+
+def test_degree_score_ranks_level_and_engineering():
+    from scraper_utils import degree_score
+
+    assert degree_score("Master of Science - MS, Computer Engineering") == 180
+    assert degree_score("Bachelor of Arts, History") == 60
+    assert degree_score("") == 0